@@ -5,19 +5,31 @@ discovered nodes, querying webcam status, and executing actions on remote nodes.
 Includes comprehensive SSRF protection, DNS pinning, and secure HTTP request handling.
 """
 
+import contextvars
+import functools
 import http.client
 import ipaddress
+import itertools
 import json
 import logging
 import os
+import random
 import socket
 import ssl
+import sys
+import threading
+import time
 import urllib.error
 import urllib.request
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple, cast
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union, cast
 from urllib.parse import quote, urlparse, urlunparse
 
+import orjson
 import sentry_sdk
 from flask import Blueprint, Flask, jsonify, redirect, request
 
@@ -74,6 +86,69 @@ def is_private_ip_allowed() -> bool:
 # Request timeout used for proxied webcam HTTP calls.
 REQUEST_TIMEOUT_SECONDS = 5.0
 
+# Keep-alive pooling for proxied webcam HTTP calls. Idle connections are keyed by
+# (scheme, hostname, port, pinned IP) so a pooled socket is only ever reused for the
+# exact vetted address it was opened against.
+_ENABLE_KEEPALIVE = True
+KEEPALIVE_IDLE_SECONDS = 30.0
+MAX_KEEPALIVE_CONNECTIONS = 4
+MAX_KEEPALIVE_CONNECTIONS_TOTAL = 32
+
+# Connectivity failure categories and reasons reported on NodeConnectivityError and
+# in API error details. Interned so classification and comparisons share one object.
+CATEGORY_DNS = sys.intern("dns")
+CATEGORY_TIMEOUT = sys.intern("timeout")
+CATEGORY_TLS = sys.intern("tls")
+CATEGORY_CONNECTION_REFUSED_OR_RESET = sys.intern("connection_refused_or_reset")
+CATEGORY_NETWORK = sys.intern("network")
+REASON_DNS_FAILED = sys.intern("dns resolution failed")
+REASON_TIMED_OUT = sys.intern("request timed out")
+REASON_TLS_FAILED = sys.intern("tls handshake failed")
+REASON_CONNECTION_REFUSED_OR_RESET = sys.intern("connection refused or reset")
+REASON_CONNECTION_FAILED = sys.intern("connection failed")
+
+# Retries for idempotent proxied webcam requests that fail transiently. Backoff is
+# truncated exponential with jitter, and every connection attempt's timeout is capped
+# to the time left before the overall deadline, so retries share one request timeout
+# instead of extending worst-case latency past it.
+REQUEST_RETRY_ATTEMPTS = 2
+RETRY_BACKOFF_BASE_SECONDS = 0.1
+RETRY_BACKOFF_MAX_SECONDS = 1.0
+RETRY_JITTER_SECONDS = 0.05
+REQUEST_RETRY_DEADLINE_SECONDS = REQUEST_TIMEOUT_SECONDS
+_RETRYABLE_METHODS = frozenset({"GET", "HEAD"})
+_RETRYABLE_CATEGORIES = frozenset({CATEGORY_TIMEOUT, CATEGORY_CONNECTION_REFUSED_OR_RESET})
+
+# Concurrent status polls when aggregating many webcams (e.g. management overview).
+MAX_STATUS_FANOUT_WORKERS = 8
+
+# Upper bound on proxied webcam response bodies; larger payloads are rejected
+# instead of being buffered in full.
+MAX_RESPONSE_BYTES = 1024 * 1024
+# Initial read buffer size when the response has no Content-Length.
+_READ_CHUNK_BYTES = 64 * 1024
+
+# DNS cache for proxied webcam targets, keyed by (hostname, port). Cached answers are
+# re-vetted against SSRF rules on every use; failed lookups are cached more briefly.
+DNS_CACHE_TTL_ENV_VAR = "MIO_DNS_CACHE_TTL_SECONDS"
+DEFAULT_DNS_CACHE_TTL_SECONDS = 60.0
+DNS_NEGATIVE_CACHE_TTL_SECONDS = 5.0
+# Discovery announcements feed arbitrary hostnames into the cache, so it is bounded
+# and evicts least recently used entries.
+MAX_DNS_CACHE_ENTRIES = 256
+
+
+def _load_dns_cache_ttl() -> float:
+    """Load the positive DNS cache TTL; ``0`` disables caching."""
+    try:
+        ttl = float(os.environ.get(DNS_CACHE_TTL_ENV_VAR, str(DEFAULT_DNS_CACHE_TTL_SECONDS)))
+    except ValueError:
+        return DEFAULT_DNS_CACHE_TTL_SECONDS
+    return max(ttl, 0.0)
+
+
+DNS_CACHE_TTL_SECONDS = _load_dns_cache_ttl()
+
 
 class NodeRequestError(RuntimeError):
     """Raised when a proxied webcam request cannot be completed safely."""
@@ -86,7 +161,7 @@ class NodeInvalidResponseError(NodeRequestError):
 class NodeConnectivityError(ConnectionError):
     """Raised when a proxied webcam request fails due to network-level connectivity issues."""
 
-    def __init__(self, message: str, reason: str, category: str, raw_error: str = ""):
+    def __init__(self, message: str, *, reason: str, category: str, raw_error: str = ""):
         super().__init__(message)
         self.reason = reason
         self.category = category
@@ -146,6 +221,26 @@ def _validate_node_base_url(base_url: str) -> None:
         raise NodeRequestError(message)
 
 
+@functools.lru_cache(maxsize=1024)
+def _classify_address(address: str) -> Tuple[bool, bool]:
+    """Classify an IP address string as (always_blocked, private).
+
+    Classification is independent of runtime configuration, so results are
+    memoized; DNS answers for polled webcams repeat across requests.
+
+    Raises:
+        ValueError: If address is not an IP address.
+    """
+    ip = ipaddress.ip_address(address)
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+
+    always_blocked = (
+        ip.is_loopback or ip.is_link_local or ip.is_multicast or ip.is_reserved or ip.is_unspecified
+    )
+    return always_blocked, ip.is_private
+
+
 def _is_blocked_address(raw: Any) -> bool:
     """Check if an IP address is blocked for SSRF protection.
 
@@ -158,26 +253,26 @@ def _is_blocked_address(raw: Any) -> bool:
     Returns:
         True if address should be blocked, False otherwise.
     """
-    ip = ipaddress.ip_address(str(raw))
-    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
-        ip = ip.ipv4_mapped
-
     # Check always-blocked categories (not configurable)
-    always_blocked = (
-        ip.is_loopback,
-        ip.is_link_local,
-        ip.is_multicast,
-        ip.is_reserved,
-        ip.is_unspecified,
-    )
-    if any(always_blocked):
+    always_blocked, is_private = _classify_address(str(raw))
+    if always_blocked:
         return True
 
     # Private IPs can be allowed if explicitly configured for internal networks
-    if is_private_ip_allowed():
-        return False
+    return is_private and not is_private_ip_allowed()
+
+
+def _iter_allowed(addresses: Iterable[str]) -> Iterator[str]:
+    """Lazily yield unique addresses that pass SSRF checks, in input order.
+
+    Args:
+        addresses: Resolved IP addresses, possibly with duplicates.
 
-    return ip.is_private
+    Returns:
+        Iterator over each allowed address, once, in first-seen order.
+    """
+    # dict.fromkeys de-duplicates in order in C; filterfalse keeps vetting lazy.
+    return itertools.filterfalse(_is_blocked_address, dict.fromkeys(addresses))
 
 
 def _vet_resolved_addresses(addresses: Tuple[str, ...]) -> Tuple[str, ...]:
@@ -187,23 +282,17 @@ def _vet_resolved_addresses(addresses: Tuple[str, ...]) -> Tuple[str, ...]:
         addresses: Tuple of resolved IP addresses.
 
     Returns:
-        Tuple of vetted addresses (blocked addresses removed).
+        Tuple of vetted addresses (blocked addresses removed), de-duplicated in order.
 
     Raises:
         NodeRequestError: If all addresses are blocked.
     """
-    vetted: list[str] = []
-    for address in addresses:
-        if _is_blocked_address(address):
-            continue
-        if address not in vetted:
-            vetted.append(address)
-
+    vetted = tuple(_iter_allowed(addresses))
     if not vetted:
         message = "webcam target is not allowed"
         raise NodeRequestError(message)
 
-    return tuple(vetted)  # type: ignore[return-value]
+    return vetted
 
 
 def _discovery_private_ip_block_response(base_url: str, blocked_target: str):
@@ -244,6 +333,66 @@ def _discovery_host_resolution_failed_response(base_url: str, unresolved_host: s
 _UNRESOLVED_DISCOVERY_HOST_PREFIX = "unresolved-host:"
 
 
+_DNS_CACHE: "OrderedDict[Tuple[str, Optional[int]], Tuple[float, Any]]" = OrderedDict()
+_DNS_CACHE_LOCK = threading.Lock()
+
+
+def _dns_cache_get(key: Tuple[str, Optional[int]], now: float) -> Any:
+    """Return a fresh cached DNS answer or failure for key, dropping it once expired."""
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(key)
+        if cached is None:
+            return None
+        if now >= cached[0]:
+            del _DNS_CACHE[key]
+            return None
+        _DNS_CACHE.move_to_end(key)
+        return cached[1]
+
+
+def _dns_cache_put(key: Tuple[str, Optional[int]], expires_at: float, result: Any) -> None:
+    """Cache a DNS answer or failure, evicting the least recently used entries."""
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = (expires_at, result)
+        _DNS_CACHE.move_to_end(key)
+        while len(_DNS_CACHE) > MAX_DNS_CACHE_ENTRIES:
+            _DNS_CACHE.popitem(last=False)
+
+
+def _resolve(host: str, port: Optional[int], *, refresh: bool = False) -> list:
+    """Resolve host via getaddrinfo, serving fresh answers from the DNS cache.
+
+    Args:
+        host: Hostname to resolve.
+        port: Optional port number for getaddrinfo.
+        refresh: Skip any cached answer and store the new lookup result.
+
+    Returns:
+        List of getaddrinfo records.
+
+    Raises:
+        socket.gaierror: If resolution fails, including a negatively cached failure.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    cached = None if refresh else _dns_cache_get(key, now)
+    if isinstance(cached, socket.gaierror):
+        raise socket.gaierror(*cached.args)
+    if cached is not None:
+        return cast("list", cached)
+
+    try:
+        records = socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
+    except socket.gaierror as exc:
+        if DNS_CACHE_TTL_SECONDS > 0:
+            _dns_cache_put(key, now + DNS_NEGATIVE_CACHE_TTL_SECONDS, exc)
+        raise
+
+    if DNS_CACHE_TTL_SECONDS > 0:
+        _dns_cache_put(key, now + DNS_CACHE_TTL_SECONDS, records)
+    return records
+
+
 def _private_announcement_blocked(base_url: str) -> Optional[str]:
     parsed = urlparse(base_url)
     hostname = parsed.hostname
@@ -256,7 +405,7 @@ def _private_announcement_blocked(base_url: str) -> Optional[str]:
         return None
     except ValueError:
         try:
-            records = socket.getaddrinfo(hostname, parsed.port or None, proto=socket.IPPROTO_TCP)
+            records = _resolve(hostname, parsed.port or None)
         except socket.gaierror:
             return f"{_UNRESOLVED_DISCOVERY_HOST_PREFIX}{hostname}"
         blocked_resolved_ips: list[str] = []
@@ -303,6 +452,93 @@ class _PinnedHTTPSConnection(http.client.HTTPSConnection):
         self.sock = self._context.wrap_socket(sock, server_hostname=self.host)
 
 
+def _build_ssl_context() -> ssl.SSLContext:
+    """Build the TLS context used for proxied HTTPS webcam requests."""
+    context = ssl.create_default_context()
+    context.check_hostname = True
+    return context
+
+
+# Loading the trust store is expensive, so one verified context is shared by every
+# HTTPS request; SSLContext is safe to use from multiple threads.
+_DEFAULT_SSL_CONTEXT = _build_ssl_context()
+
+
+_PoolKey = Tuple[bool, str, Optional[int], str]
+
+_CONNECTION_POOL: Dict[_PoolKey, Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+_CONNECTION_POOL_LOCK = threading.Lock()
+
+
+def _evict_idle_locked(now: float) -> list[http.client.HTTPConnection]:
+    """Drop expired idle connections across every pool key.
+
+    Must be called with ``_CONNECTION_POOL_LOCK`` held; keys left without idle
+    connections are removed so webcams that are no longer polled do not linger.
+
+    Returns:
+        The evicted connections, to be closed once the lock is released.
+    """
+    expired: list[http.client.HTTPConnection] = []
+    for key in list(_CONNECTION_POOL):
+        idle = _CONNECTION_POOL[key]
+        while idle and now - idle[0][1] > KEEPALIVE_IDLE_SECONDS:
+            expired.append(idle.popleft()[0])
+        if not idle:
+            del _CONNECTION_POOL[key]
+    return expired
+
+
+def _acquire_conn(key: _PoolKey) -> Optional[http.client.HTTPConnection]:
+    """Pop the most recently used idle connection for key, evicting expired ones.
+
+    Args:
+        key: Pool key of (is_https, hostname, port, pinned address).
+
+    Returns:
+        A pooled connection, or None when no fresh idle connection is available.
+    """
+    connection = None
+    with _CONNECTION_POOL_LOCK:
+        expired = _evict_idle_locked(time.monotonic())
+        idle = _CONNECTION_POOL.get(key)
+        if idle:
+            connection = idle.pop()[0]
+    for stale in expired:
+        stale.close()
+    return connection
+
+
+def _release_conn(key: _PoolKey, connection: http.client.HTTPConnection) -> None:
+    """Return a connection to the idle pool, closing it when the pool is full.
+
+    The pool is bounded both per key and across all keys.
+    """
+    now = time.monotonic()
+    with _CONNECTION_POOL_LOCK:
+        expired = _evict_idle_locked(now)
+        idle = _CONNECTION_POOL.get(key, ())
+        pooled_total = sum(len(connections) for connections in _CONNECTION_POOL.values())
+        pooled = (
+            len(idle) < MAX_KEEPALIVE_CONNECTIONS and pooled_total < MAX_KEEPALIVE_CONNECTIONS_TOTAL
+        )
+        if pooled:
+            _CONNECTION_POOL.setdefault(key, deque()).append((connection, now))
+    for stale in expired:
+        stale.close()
+    if not pooled:
+        connection.close()
+
+
+def _clear_connection_pool() -> None:
+    """Close and drop every idle pooled connection."""
+    with _CONNECTION_POOL_LOCK:
+        idle_connections = [conn for idle in _CONNECTION_POOL.values() for conn, _ in idle]
+        _CONNECTION_POOL.clear()
+    for connection in idle_connections:
+        connection.close()
+
+
 def _error_response(
     code: str,
     message: str,
@@ -393,13 +629,42 @@ def _discovery_metadata(existing: Optional[Dict[str, Any]] = None) -> Dict[str,
     }
 
 
-def _build_headers(node: Dict[str, Any]) -> Dict[str, str]:
+def _bearer_token(node: Dict[str, Any]) -> Optional[str]:
     auth = node.get("auth", {})
-    if auth.get("type") == "bearer" and auth.get("token"):
-        return {"Authorization": f"Bearer {auth['token']}"}
+    token = auth.get("token")
+    if auth.get("type") == "bearer" and token and isinstance(token, str):
+        return token
+    return None
+
+
+def _build_headers(node: Dict[str, Any]) -> Dict[str, str]:
+    token = _bearer_token(node)
+    if token:
+        return {"Authorization": f"Bearer {token}"}
     return {}
 
 
+@functools.lru_cache(maxsize=512)
+def _base_request_headers(host_header: str) -> Mapping[str, str]:
+    """Return the read-only, credential-free header set for a webcam Host.
+
+    Memoized per Host so repeated polls of a webcam reuse one header mapping.
+    """
+    return MappingProxyType({"Content-Type": "application/json", "Host": host_header})
+
+
+def _request_headers(host_header: str, bearer_token: Optional[str]) -> Mapping[str, str]:
+    """Return the headers for a proxied webcam request.
+
+    The Authorization header is added per call so bearer tokens are never held
+    as memoization keys or cached values.
+    """
+    base_headers = _base_request_headers(host_header)
+    if not bearer_token:
+        return base_headers
+    return {**base_headers, "Authorization": f"Bearer {bearer_token}"}
+
+
 def _sanitize_error_text(raw_error: str, limit: int = 240) -> str:
     collapsed = " ".join(raw_error.split())
     if len(collapsed) <= limit:
@@ -407,6 +672,29 @@ def _sanitize_error_text(raw_error: str, limit: int = 240) -> str:
     return f"{collapsed[: limit - 3]}..."
 
 
+# Connection failure classification, checked in order: exception types first, then
+# substrings of the error text for errors wrapped by urllib or reported as strings.
+_EXCEPTION_CATEGORIES: Tuple[Tuple[Tuple[type, ...], str, str], ...] = (
+    ((socket.gaierror,), REASON_DNS_FAILED, CATEGORY_DNS),
+    ((socket.timeout, TimeoutError), REASON_TIMED_OUT, CATEGORY_TIMEOUT),
+    ((ssl.SSLError, ssl.CertificateError), REASON_TLS_FAILED, CATEGORY_TLS),
+    (
+        (ConnectionRefusedError, ConnectionResetError),
+        REASON_CONNECTION_REFUSED_OR_RESET,
+        CATEGORY_CONNECTION_REFUSED_OR_RESET,
+    ),
+)
+_ERROR_TEXT_CATEGORIES: Tuple[Tuple[Tuple[str, ...], str, str], ...] = (
+    (("timed out",), REASON_TIMED_OUT, CATEGORY_TIMEOUT),
+    (("certificate", "ssl", "tls", "wrong version number"), REASON_TLS_FAILED, CATEGORY_TLS),
+    (
+        ("connection refused", "connection reset", "broken pipe"),
+        REASON_CONNECTION_REFUSED_OR_RESET,
+        CATEGORY_CONNECTION_REFUSED_OR_RESET,
+    ),
+)
+
+
 def _classify_url_error(reason: Any) -> Tuple[str, str]:
     """Classify URL/network errors into human-readable categories.
 
@@ -416,23 +704,15 @@ def _classify_url_error(reason: Any) -> Tuple[str, str]:
     Returns:
         Tuple of (human_readable_reason, category_code).
     """
-    if isinstance(reason, (socket.timeout, TimeoutError)):
-        return "request timed out", "timeout"
-    if isinstance(reason, (ssl.SSLError, ssl.CertificateError)):
-        return "tls handshake failed", "tls"
-    if isinstance(reason, (ConnectionRefusedError, ConnectionResetError)):
-        return "connection refused or reset", "connection_refused_or_reset"
+    for exception_types, label, category in _EXCEPTION_CATEGORIES:
+        if isinstance(reason, exception_types):
+            return label, category
 
     reason_text = str(reason).lower()
-    if "timed out" in reason_text:
-        return "request timed out", "timeout"
-    if any(token in reason_text for token in ("certificate", "ssl", "tls", "wrong version number")):
-        return "tls handshake failed", "tls"
-    if any(
-        token in reason_text for token in ("connection refused", "connection reset", "broken pipe")
-    ):
-        return "connection refused or reset", "connection_refused_or_reset"
-    return "connection failed", "network"
+    for tokens, label, category in _ERROR_TEXT_CATEGORIES:
+        if any(token in reason_text for token in tokens):
+            return label, category
+    return REASON_CONNECTION_FAILED, CATEGORY_NETWORK
 
 
 def _netloc_has_explicit_port(netloc: str) -> bool:
@@ -461,45 +741,192 @@ def _build_host_header(parsed_url) -> str:
     return host
 
 
-def _resolve_and_vet_addresses(hostname_str: str, port: Optional[int]) -> Tuple[str, ...]:
-    """Resolve hostname and vet resulting IP addresses against SSRF rules.
+@dataclass(frozen=True, slots=True)
+class _ParsedTarget:
+    """Connection details decomposed from a webcam base URL."""
+
+    is_https: bool
+    hostname: str
+    port: Optional[int]
+    host_header: str
+    path_prefix: str
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_base_url(base_url: str) -> _ParsedTarget:
+    """Decompose a webcam base URL into the parts needed to open a request.
+
+    Memoized per base URL since polled webcams are requested repeatedly.
+
+    Args:
+        base_url: Webcam base URL without trailing slash.
+
+    Returns:
+        Parsed target with scheme, hostname, port, Host header and path prefix.
+
+    Raises:
+        NodeRequestError: If the URL has no hostname.
+    """
+    parsed_url = urlparse(base_url)
+    hostname = parsed_url.hostname
+    if not hostname:
+        message = "webcam target is invalid"
+        raise NodeRequestError(message)
+
+    return _ParsedTarget(
+        is_https=parsed_url.scheme == "https",
+        hostname=str(hostname),
+        port=parsed_url.port,
+        host_header=_build_host_header(parsed_url),
+        path_prefix=urlunparse(("", "", parsed_url.path, parsed_url.params, parsed_url.query, "")),
+    )
+
+
+def _resolve_and_vet_addresses(hostname_str: str, port: Optional[int]) -> Iterator[str]:
+    """Resolve hostname and lazily vet resulting IP addresses against SSRF rules.
+
+    Resolution and hostname checks happen eagerly; the returned iterator vets each
+    address only as the caller reaches it.
 
     Args:
         hostname_str: Hostname to resolve (already validated for blocked addresses).
         port: Optional port number for getaddrinfo.
 
     Returns:
-        Tuple of vetted IP addresses.
+        Iterator over allowed, de-duplicated IP addresses.
 
     Raises:
         NodeRequestError: If hostname is blocked by SSRF.
         NodeConnectivityError: If DNS resolution fails.
-        ConnectionError: If no addresses pass vetting.
     """
     try:
         if _is_blocked_address(hostname_str):
             message = "webcam target is not allowed"
             raise NodeRequestError(message)
-        resolved_addresses: Tuple[str, ...] = (hostname_str,)
+        return iter((hostname_str,))
     except ValueError:
         try:
-            records = socket.getaddrinfo(hostname_str, port or None, proto=socket.IPPROTO_TCP)
+            records = _resolve(hostname_str, port or None)
         except socket.gaierror as exc:
-            error_message = "dns resolution failed"
             raise NodeConnectivityError(
-                error_message,
-                reason="dns resolution failed",
-                category="dns",
+                REASON_DNS_FAILED,
+                reason=REASON_DNS_FAILED,
+                category=CATEGORY_DNS,
                 raw_error=str(exc),
             ) from exc
-        resolved_addresses = tuple(cast("str", record[4][0]) for record in records)
+        return _iter_allowed(cast("str", record[4][0]) for record in records)
+
+
+def _new_pinned_connection(
+    is_https: bool,
+    hostname: str,
+    port: Optional[int],
+    address: str,
+    tls_context: Optional[ssl.SSLContext],
+    *,
+    timeout: float = REQUEST_TIMEOUT_SECONDS,
+) -> http.client.HTTPConnection:
+    """Open a new DNS-pinned HTTP(S) connection object for a vetted address."""
+    if is_https:
+        return _PinnedHTTPSConnection(
+            host=hostname,
+            port=port,
+            connect_host=address,
+            timeout=timeout,
+            context=tls_context,
+        )
+    return _PinnedHTTPConnection(
+        host=hostname,
+        port=port,
+        connect_host=address,
+        timeout=timeout,
+    )
 
-    vetted_addresses: Tuple[str, ...] = _vet_resolved_addresses(tuple(resolved_addresses))
-    if not vetted_addresses:
-        message = "name resolution returned no addresses"
-        raise ConnectionError(message)
 
-    return vetted_addresses
+def _set_connection_timeout(connection: http.client.HTTPConnection, timeout: float) -> None:
+    """Apply timeout to a pooled connection and its already open socket."""
+    connection.timeout = timeout
+    if connection.sock is not None:
+        connection.sock.settimeout(timeout)
+
+
+_READ_BUFFERS = threading.local()
+
+
+def _read_body(response: http.client.HTTPResponse, limit: int) -> memoryview:
+    """Read up to ``limit + 1`` body bytes into a reusable per-thread buffer.
+
+    The buffer is preallocated from Content-Length when known and doubled as
+    needed otherwise, so callers can detect oversized bodies without buffering
+    them in full.
+
+    Args:
+        response: Response to read from.
+        limit: Maximum accepted body size in bytes.
+
+    Returns:
+        View of the bytes read; only valid until the next read on this thread.
+    """
+    expected = response.length
+    if expected is not None and expected <= limit:
+        size = expected + 1
+    else:
+        size = min(_READ_CHUNK_BYTES, limit + 1)
+    buffer = getattr(_READ_BUFFERS, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = bytearray(size)
+        _READ_BUFFERS.buffer = buffer
+
+    view = memoryview(buffer)[: limit + 1]
+    filled = 0
+    while filled <= limit:
+        if filled == len(view):
+            grown = bytearray(min(len(view) * 2, limit + 1))
+            grown[:filled] = view[:filled]
+            _READ_BUFFERS.buffer = grown
+            view = memoryview(grown)
+        count = response.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return view[:filled]
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Encode a proxied request body as UTF-8 JSON."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _decode_json_object(raw_body: Union[bytes, memoryview]) -> dict:
+    """Decode a webcam response body that must hold a single JSON object.
+
+    Args:
+        raw_body: Raw response bytes; an empty body decodes to an empty dict.
+
+    Returns:
+        Decoded JSON object.
+
+    Raises:
+        NodeInvalidResponseError: If the body is not UTF-8, is malformed or has
+            trailing data, or is not a JSON object.
+    """
+    try:
+        body_text = str(raw_body, "utf-8")
+    except UnicodeDecodeError as exc:
+        message = "webcam returned non-UTF8 payload"
+        raise NodeInvalidResponseError(message) from exc
+    if not body_text:
+        return {}
+    try:
+        # orjson rejects trailing data and NaN/Infinity literals as malformed.
+        body_json = orjson.loads(body_text)
+    except orjson.JSONDecodeError as exc:
+        message = "webcam returned malformed JSON"
+        raise NodeInvalidResponseError(message) from exc
+    if not isinstance(body_json, dict):
+        message = "webcam returned non-object JSON"
+        raise NodeInvalidResponseError(message)
+    return body_json
 
 
 def _attempt_pinned_connection(
@@ -509,12 +936,18 @@ def _attempt_pinned_connection(
     address: str,
     *,
     request_target: str,
-    headers: Dict[str, str],
+    headers: Mapping[str, str],
     data: Optional[bytes],
     method: str,
     tls_context: Optional[ssl.SSLContext],
+    timeout: float = REQUEST_TIMEOUT_SECONDS,
 ) -> Tuple[int, dict]:
-    """Attempt single DNS-pinned HTTP(S) connection to address.
+    """Attempt single DNS-pinned HTTP(S) request to address.
+
+    Idempotent requests reuse an idle keep-alive connection for the same pinned
+    target when one is pooled; other methods always open a fresh connection, since
+    a request on a socket the peer already closed cannot be safely resent. The
+    connection is returned to the pool when the response allows it.
 
     Args:
         is_https: Whether to use HTTPS.
@@ -526,6 +959,7 @@ def _attempt_pinned_connection(
         data: Request body bytes.
         method: HTTP method.
         tls_context: SSL context (for HTTPS).
+        timeout: Socket timeout in seconds for this attempt.
 
     Returns:
         Tuple of (http_status_code, response_json_dict).
@@ -534,45 +968,43 @@ def _attempt_pinned_connection(
         urllib.error.URLError, OSError, ssl.SSLError: Connection errors.
         NodeInvalidResponseError: If response JSON is malformed.
     """
-    actual_connection: _PinnedHTTPConnection | _PinnedHTTPSConnection | None = None
+    pool_key: _PoolKey = (is_https, hostname, port, address)
+    pooled_connection = (
+        _acquire_conn(pool_key)
+        if _ENABLE_KEEPALIVE and method.upper() in _RETRYABLE_METHODS
+        else None
+    )
+    if pooled_connection is not None:
+        _set_connection_timeout(pooled_connection, timeout)
+    actual_connection = pooled_connection or _new_pinned_connection(
+        is_https, hostname, port, address, tls_context, timeout=timeout
+    )
+    reusable = False
     try:
-        if is_https:
-            actual_connection = _PinnedHTTPSConnection(
-                host=hostname,
-                port=port,
-                connect_host=address,
-                timeout=REQUEST_TIMEOUT_SECONDS,
-                context=tls_context,
-            )
-        else:
-            actual_connection = _PinnedHTTPConnection(
-                host=hostname,
-                port=port,
-                connect_host=address,
-                timeout=REQUEST_TIMEOUT_SECONDS,
-            )
-
-        actual_connection.request(method, request_target, body=data, headers=headers)
-        response = actual_connection.getresponse()
-        raw_body = response.read()
-        try:
-            body_text = raw_body.decode("utf-8")
-        except UnicodeDecodeError as exc:
-            message = "webcam returned non-UTF8 payload"
-            raise NodeInvalidResponseError(message) from exc
-        if not body_text:
-            return response.status, {}
         try:
-            body_json = json.loads(body_text)
-        except json.JSONDecodeError as exc:
-            message = "webcam returned malformed JSON"
-            raise NodeInvalidResponseError(message) from exc
-        if not isinstance(body_json, dict):
-            message = "webcam returned non-object JSON"
+            actual_connection.request(method, request_target, body=data, headers=headers)
+            response = actual_connection.getresponse()
+        except (ConnectionResetError, BrokenPipeError):
+            # The peer may have dropped an idle keep-alive socket; retry once on a
+            # fresh connection before surfacing the failure.
+            if pooled_connection is None:
+                raise
+            actual_connection.close()
+            actual_connection = _new_pinned_connection(
+                is_https, hostname, port, address, tls_context, timeout=timeout
+            )
+            actual_connection.request(method, request_target, body=data, headers=headers)
+            response = actual_connection.getresponse()
+        raw_body = _read_body(response, MAX_RESPONSE_BYTES)
+        if len(raw_body) > MAX_RESPONSE_BYTES:
+            message = "webcam response exceeds size limit"
             raise NodeInvalidResponseError(message)
-        return response.status, body_json
+        reusable = _ENABLE_KEEPALIVE and getattr(response, "will_close", True) is False
+        return response.status, _decode_json_object(raw_body)
     finally:
-        if actual_connection is not None:
+        if reusable:
+            _release_conn(pool_key, actual_connection)
+        else:
             actual_connection.close()
 
 
@@ -581,6 +1013,7 @@ def _request_json(node: Dict[str, Any], method: str, path: str, body: Optional[d
 
     Performs DNS resolution, validates resolved IPs against SSRF rules, then
     establishes HTTPS/HTTP connection with DNS pinning to prevent response spoofing.
+    Idempotent requests that time out or are refused/reset are retried with backoff.
 
     Args:
         node: Node dict with 'base_url' and optional 'auth' fields.
@@ -614,42 +1047,91 @@ def _request_json(node: Dict[str, Any], method: str, path: str, body: Optional[d
         },
     )
 
-    url = base_url + path
-    parsed_url = urlparse(url)
-    hostname = parsed_url.hostname
-    if not hostname:
-        message = "webcam target is invalid"
-        raise NodeRequestError(message)
+    target = _parse_base_url(base_url)
+    headers = _request_headers(target.host_header, _bearer_token(node))
+    data = _json_dumps(body) if body is not None else None
+    request_target = target.path_prefix + path or "/"
 
-    port = parsed_url.port
-    # Explicitly cast hostname to str to help MyPy inference
-    hostname_str = str(hostname)
+    deadline = time.monotonic() + REQUEST_RETRY_DEADLINE_SECONDS
+    attempt = 0
+    while True:
+        try:
+            return _send_pinned_request(
+                target, method, request_target, headers, data, deadline=deadline
+            )
+        except NodeConnectivityError as exc:
+            delay = _retry_delay(attempt, method, exc.category, deadline)
+            if delay is None:
+                raise
+            attempt += 1
+            time.sleep(delay)
 
-    # Resolve and vet addresses
-    vetted_addresses = _resolve_and_vet_addresses(hostname_str, port)
 
-    headers = {"Content-Type": "application/json", **_build_headers(node)}
-    headers.setdefault("Host", _build_host_header(parsed_url))
-    data = json.dumps(body).encode("utf-8") if body is not None else None
-    request_target = (
-        urlunparse(("", "", parsed_url.path, parsed_url.params, parsed_url.query, "")) or "/"
-    )
-    is_https = parsed_url.scheme == "https"
-    tls_context = ssl.create_default_context() if is_https else None
+def _retry_delay(attempt: int, method: str, category: str, deadline: float) -> Optional[float]:
+    """Return the backoff before retrying a failed request, or None to give up.
+
+    Only idempotent requests that failed with a transient category are retried,
+    using truncated exponential backoff with jitter that must fit the deadline.
+    """
+    if (
+        attempt >= REQUEST_RETRY_ATTEMPTS
+        or method.upper() not in _RETRYABLE_METHODS
+        or category not in _RETRYABLE_CATEGORIES
+    ):
+        return None
+    delay = min(RETRY_BACKOFF_BASE_SECONDS * 2.0**attempt, RETRY_BACKOFF_MAX_SECONDS)
+    delay += random.uniform(0, RETRY_JITTER_SECONDS)  # nosec B311 - jitter, not crypto
+    if time.monotonic() + delay >= deadline:
+        return None
+    return delay
+
+
+def _send_pinned_request(
+    target: _ParsedTarget,
+    method: str,
+    request_target: str,
+    headers: Mapping[str, str],
+    data: Optional[bytes],
+    *,
+    deadline: float,
+) -> Tuple[int, dict]:
+    """Resolve target once and try each vetted address until one responds.
+
+    Each attempt's timeout is capped to the time remaining before ``deadline``.
+
+    Raises:
+        NodeRequestError: On SSRF blocking.
+        NodeConnectivityError: On DNS failure or when every address fails.
+        NodeInvalidResponseError: If webcam returns invalid JSON.
+    """
+    vetted_addresses = _resolve_and_vet_addresses(target.hostname, target.port)
+    tls_context = _DEFAULT_SSL_CONTEXT if target.is_https else None
 
     connection_errors = []
     for address in vetted_addresses:
+        timeout = min(REQUEST_TIMEOUT_SECONDS, deadline - time.monotonic())
+        if timeout <= 0:
+            connection_errors.append(
+                NodeConnectivityError(
+                    REASON_TIMED_OUT,
+                    reason=REASON_TIMED_OUT,
+                    category=CATEGORY_TIMEOUT,
+                    raw_error="request deadline exceeded",
+                )
+            )
+            break
         try:
             return _attempt_pinned_connection(
-                is_https=is_https,
-                hostname=hostname_str,
-                port=port,
+                is_https=target.is_https,
+                hostname=target.hostname,
+                port=target.port,
                 address=address,
                 request_target=request_target,
                 headers=headers,
                 data=data,
                 method=method,
                 tls_context=tls_context,
+                timeout=timeout,
             )
         except NodeInvalidResponseError:
             raise
@@ -673,12 +1155,13 @@ def _request_json(node: Dict[str, Any], method: str, path: str, body: Optional[d
         raise NodeConnectivityError(
             reason,
             reason=reason,
-            category="network",
+            category=CATEGORY_NETWORK,
             raw_error=raw_error,
         )
 
-    error_message = "all connection attempts failed"
-    raise ConnectionError(error_message)
+    # No address survived SSRF vetting, so nothing was attempted.
+    message = "webcam target is not allowed"
+    raise NodeRequestError(message)
 
 
 def _parse_docker_url(base_url: str) -> Tuple[str, int, str]:
@@ -752,22 +1235,22 @@ def _get_docker_container_status(
             raise NodeConnectivityError(
                 error_message,
                 reason="connection refused",
-                category="connection_refused_or_reset",
+                category=CATEGORY_CONNECTION_REFUSED_OR_RESET,
                 raw_error=reason_msg,
             ) from exc
         if "timed out" in reason_msg.lower():
             error_message = "docker proxy request timed out"
             raise NodeConnectivityError(
                 error_message,
-                reason="request timed out",
-                category="timeout",
+                reason=REASON_TIMED_OUT,
+                category=CATEGORY_TIMEOUT,
                 raw_error=reason_msg,
             ) from exc
         error_message = "docker proxy connection failed"
         raise NodeConnectivityError(
             error_message,
-            reason="connection failed",
-            category="network",
+            reason=REASON_CONNECTION_FAILED,
+            category=CATEGORY_NETWORK,
             raw_error=reason_msg,
         ) from exc
 
@@ -799,6 +1282,9 @@ def _build_diagnostics_result(webcam_id: str) -> Dict[str, Any]:
 def _check_dns_resolution(hostname: str, port: Optional[int]) -> Tuple[bool, list, Optional[str]]:
     """Resolve hostname to list of IP addresses using DNS.
 
+    Always performs a fresh lookup and refreshes the DNS cache, so the
+    follow-up diagnostic request reuses this answer instead of resolving again.
+
     Args:
         hostname: DNS hostname to resolve.
         port: Optional port number for socket resolution.
@@ -808,10 +1294,10 @@ def _check_dns_resolution(hostname: str, port: Optional[int]) -> Tuple[bool, lis
         On success, resolved_ips contains unique IP addresses; on failure, error_string is set.
 
     Raises:
-        socket.gaierror: Re-raised from socket.getaddrinfo if DNS lookup fails.
+        socket.gaierror: Re-raised from _resolve if DNS lookup fails.
     """
     try:
-        records = socket.getaddrinfo(hostname, port, proto=socket.IPPROTO_TCP)
+        records = _resolve(hostname, port, refresh=True)
         resolved_ips = list({record[4][0] for record in records})
         return True, resolved_ips, None
     except socket.gaierror as exc:
@@ -978,8 +1464,8 @@ def _diagnose_docker_transport(
     except NodeConnectivityError as exc:
         results["diagnostics"]["network_connectivity"].update(
             {
-                "reachable": exc.category != "timeout",
-                "status": "warn" if exc.category != "timeout" else "fail",
+                "reachable": exc.category != CATEGORY_TIMEOUT,
+                "status": "warn" if exc.category != CATEGORY_TIMEOUT else "fail",
                 "error": exc.reason,
                 "category": exc.category,
                 "code": "NETWORK_CONNECTIVITY_ERROR",
@@ -991,9 +1477,9 @@ def _diagnose_docker_transport(
             )
 
         guidance_map = {
-            "timeout": f"Network Timeout: Docker proxy took longer than {REQUEST_TIMEOUT_SECONDS}s to respond. Check docker proxy service and network latency.",
-            "connection_refused_or_reset": "Connection Error: Docker proxy refused connection. Ensure docker-socket-proxy is running on correct port.",
-            "network": "Network Error: Unable to reach docker proxy. Check network connectivity and firewall rules.",
+            CATEGORY_TIMEOUT: f"Network Timeout: Docker proxy took longer than {REQUEST_TIMEOUT_SECONDS}s to respond. Check docker proxy service and network latency.",
+            CATEGORY_CONNECTION_REFUSED_OR_RESET: "Connection Error: Docker proxy refused connection. Ensure docker-socket-proxy is running on correct port.",
+            CATEGORY_NETWORK: "Network Error: Unable to reach docker proxy. Check network connectivity and firewall rules.",
         }
         add_recommendation(
             guidance_map.get(exc.category, f"Docker proxy error: {exc.reason}"),
@@ -1085,7 +1571,7 @@ def _diagnose_http_transport(
         return results
 
     # DNS resolution
-    dns_success, resolved_ips, dns_error = _check_dns_resolution(hostname, parsed.port or 443)
+    dns_success, resolved_ips, dns_error = _check_dns_resolution(hostname, parsed.port or None)
     if not dns_success:
         results["diagnostics"]["dns_resolution"].update(
             {
@@ -1215,8 +1701,8 @@ def _diagnose_http_transport(
     elif isinstance(api_exception, NodeConnectivityError):
         results["diagnostics"]["network_connectivity"].update(
             {
-                "reachable": api_exception.category != "timeout",
-                "status": "warn" if api_exception.category != "timeout" else "fail",
+                "reachable": api_exception.category != CATEGORY_TIMEOUT,
+                "status": "warn" if api_exception.category != CATEGORY_TIMEOUT else "fail",
                 "error": api_exception.reason,
                 "category": api_exception.category,
                 "code": "NETWORK_CONNECTIVITY_ERROR",
@@ -1228,11 +1714,11 @@ def _diagnose_http_transport(
             )
 
         guidance_map = {
-            "dns": "DNS Resolution: Unable to resolve hostname. Check spelling and network DNS.",
-            "timeout": f"Network Timeout: Node took longer than {REQUEST_TIMEOUT_SECONDS}s to respond. Check webcam health, network latency, and camera processing load.",
-            "tls": "TLS Error: SSL/TLS handshake failed. Check webcam certificate or use http://.",
-            "connection_refused_or_reset": "Connection Error: Node refused connection. Ensure webcam is running on correct port.",
-            "network": "Network Error: Unable to reach node. Check network connectivity and firewall rules.",
+            CATEGORY_DNS: "DNS Resolution: Unable to resolve hostname. Check spelling and network DNS.",
+            CATEGORY_TIMEOUT: f"Network Timeout: Node took longer than {REQUEST_TIMEOUT_SECONDS}s to respond. Check webcam health, network latency, and camera processing load.",
+            CATEGORY_TLS: "TLS Error: SSL/TLS handshake failed. Check webcam certificate or use http://.",
+            CATEGORY_CONNECTION_REFUSED_OR_RESET: "Connection Error: Node refused connection. Ensure webcam is running on correct port.",
+            CATEGORY_NETWORK: "Network Error: Unable to reach node. Check network connectivity and firewall rules.",
         }
         add_recommendation(
             guidance_map.get(api_exception.category, f"Network error: {api_exception.reason}"),
@@ -1452,8 +1938,8 @@ def _get_http_status(
             503,
             webcam_id,
             {
-                "reason": "connection failed",
-                "category": "network",
+                "reason": REASON_CONNECTION_FAILED,
+                "category": CATEGORY_NETWORK,
                 "raw_error": _sanitize_error_text(str(exc)),
             },
         )
@@ -1525,6 +2011,44 @@ def _status_for_webcam(node: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[T
     return _get_http_status(node)
 
 
+def _statuses_for_webcams(
+    nodes: list[Dict[str, Any]],
+) -> list[Tuple[Dict[str, Any], Optional[Tuple]]]:
+    """Fetch status for several webcams concurrently, preserving input order.
+
+    Wall-clock time tracks the slowest webcam rather than the sum of all of them.
+    Worker threads do not inherit the request's Sentry scope, so the request scope
+    is tagged before dispatch and each poll runs in its own fork of it; per-webcam
+    tags set by ``_request_json`` stay on that poll instead of racing on one scope.
+
+    Args:
+        nodes: Webcam dicts to poll.
+
+    Returns:
+        One ``_status_for_webcam`` result per node, in the same order.
+    """
+    if len(nodes) <= 1:
+        return [_status_for_webcam(node) for node in nodes]
+    sentry_sdk.get_current_scope().set_tag("component", "management")
+    contexts = [contextvars.copy_context() for _ in nodes]
+    with ThreadPoolExecutor(max_workers=min(MAX_STATUS_FANOUT_WORKERS, len(nodes))) as executor:
+        return list(
+            executor.map(
+                lambda context, node: context.run(_status_for_webcam_in_new_scope, node),
+                contexts,
+                nodes,
+            )
+        )
+
+
+def _status_for_webcam_in_new_scope(
+    node: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Optional[Tuple]]:
+    """Run ``_status_for_webcam`` in a Sentry scope forked from the caller's."""
+    with sentry_sdk.new_scope():
+        return _status_for_webcam(node)
+
+
 def _register_management_deprecated_v0_aliases(app: Flask) -> None:
     """Register legacy /api/* routes that redirect (HTTP 308) to /api/v1/* equivalents.
 
@@ -1951,7 +2475,7 @@ def create_management_blueprint(
                 f"webcam {webcam_id} is unreachable",
                 503,
                 webcam_id=webcam_id,
-                details={"reason": "connection failed", "action": action},
+                details={"reason": REASON_CONNECTION_FAILED, "action": action},
             )
 
         if status_code in {401, 403}:
@@ -1982,8 +2506,7 @@ def create_management_blueprint(
             raise
         statuses = []
         unavailable_nodes = 0
-        for webcam in nodes:
-            result, error = _status_for_webcam(webcam)
+        for webcam, (result, error) in zip(nodes, _statuses_for_webcams(nodes)):
             if error:
                 unavailable_nodes += 1
                 statuses.append(
@@ -29,6 +29,18 @@ def workspace_root():
     return WORKSPACE_ROOT
 
 
+@pytest.fixture(scope="session")
+def main_module():
+    """Import the application entrypoint once per session.
+
+    App factories read configuration through ``_load_config()`` at call time, so
+    tests can set env vars and build fresh apps without re-importing the module.
+    """
+    from pi_camera_in_docker import main
+
+    return main
+
+
 @pytest.fixture
 def tmp_app_settings_path(tmp_path):
     """Return path to temporary application settings file."""
@@ -71,6 +83,58 @@ def full_config(tmp_app_settings_path):
     }
 
 
+class FakeUpstream:
+    """Table-driven stand-in for ``management_api._request_json``.
+
+    Upstream responses are registered per ``(method, path)`` and looked up with a
+    single dict access, so tests declare routes instead of hand-writing
+    ``if path == ...`` dispatch closures. Every call is recorded in ``calls``.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.calls = []
+
+    def route(self, method, path, status=200, body=None, error=None):
+        """Register the ``(status, body)`` returned for ``method`` and ``path``.
+
+        When ``error`` is given, requests to the route raise it instead.
+        """
+        self.routes[(method.upper(), path)] = (
+            error if error is not None else (status, {} if body is None else body)
+        )
+        return self
+
+    def __call__(self, node, method, path, body=None):
+        self.calls.append((node.get("id"), method, path, body))
+        try:
+            result = self.routes[(method.upper(), path)]
+        except KeyError:
+            message = f"unexpected upstream request: {method} {path}"
+            raise AssertionError(message) from None
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+@pytest.fixture
+def fake_upstream():
+    """Return an empty FakeUpstream route table."""
+    return FakeUpstream()
+
+
+@pytest.fixture(autouse=True)
+def clear_management_dns_cache():
+    """Drop cached DNS answers so tests that patch ``getaddrinfo`` stay deterministic."""
+    management_api = sys.modules.get("pi_camera_in_docker.management_api")
+    if management_api is not None:
+        management_api._DNS_CACHE.clear()
+    yield
+    management_api = sys.modules.get("pi_camera_in_docker.management_api")
+    if management_api is not None:
+        management_api._DNS_CACHE.clear()
+
+
 def pytest_collection_modifyitems(config, items):
     """
     Skip tests that require unavailable dependencies or specific environments.
@@ -1,12 +1,9 @@
 """Integration tests for the README help API endpoint."""
 
-import importlib
-import sys
 import urllib.error
 from pathlib import Path
 
-
-workspace_root = Path(__file__).resolve().parents[2]
+from pi_camera_in_docker import main
 
 
 def _new_management_client(monkeypatch, tmp_path, management_token="test-token", path_type=None):
@@ -20,19 +17,11 @@ def _new_management_client(monkeypatch, tmp_path, management_token="test-token",
     monkeypatch.setenv("MIO_MANAGEMENT_AUTH_TOKEN", management_token)
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(0, str(workspace_root))
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        sys.modules.pop("pi_camera_in_docker.management_api", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-        if path_type is not None:
-            # Create a fake non-existent path
-            fake_path = path_type(__file__).parent / "README_DOES_NOT_EXIST_FOR_TEST.md"
-            monkeypatch.setattr(main, "_readme_path", fake_path)
-        return main.create_management_app(main._load_config()).test_client()
-    finally:
-        sys.path = original_sys_path
+    if path_type is not None:
+        # Create a fake non-existent path
+        fake_path = path_type(__file__).parent / "README_DOES_NOT_EXIST_FOR_TEST.md"
+        monkeypatch.setattr(main, "_readme_path", fake_path)
+    return main.create_management_app(main._load_config()).test_client()
 
 
 class TestReadmeHelpEndpointIntegration:
@@ -1,11 +1,6 @@
 """Integration tests for /api/metrics/stream webcam control-plane auth behavior."""
 
-import importlib
-import sys
-from pathlib import Path
-
-
-workspace_root = Path(__file__).resolve().parents[2]
+from pi_camera_in_docker import main
 
 
 def _new_webcam_client(monkeypatch, tmp_path, webcam_token=""):
@@ -18,14 +13,7 @@ def _new_webcam_client(monkeypatch, tmp_path, webcam_token=""):
     monkeypatch.setenv("MIO_WEBCAM_CONTROL_PLANE_AUTH_TOKEN", webcam_token)
     monkeypatch.setenv("MOCK_CAMERA", "true")
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(0, str(workspace_root))
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-        return main.create_webcam_app(main._load_config()).test_client()
-    finally:
-        sys.path = original_sys_path
+    return main.create_webcam_app(main._load_config()).test_client()
 
 
 def test_metrics_stream_requires_auth_when_webcam_token_configured(monkeypatch, tmp_path):
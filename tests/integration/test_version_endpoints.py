@@ -1,11 +1,6 @@
 """Integration tests for shared version endpoints."""
 
-import importlib
-import sys
-from pathlib import Path
-
-
-workspace_root = Path(__file__).resolve().parents[2]
+from pi_camera_in_docker import main
 
 
 def _new_management_client(monkeypatch, tmp_path, management_token=""):
@@ -19,14 +14,7 @@ def _new_management_client(monkeypatch, tmp_path, management_token=""):
     monkeypatch.setenv("MIO_MANAGEMENT_AUTH_TOKEN", management_token)
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(0, str(workspace_root))
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-        return main.create_management_app(main._load_config()).test_client()
-    finally:
-        sys.path = original_sys_path
+    return main.create_management_app(main._load_config()).test_client()
 
 
 def _new_webcam_client(monkeypatch, tmp_path, webcam_token=""):
@@ -39,14 +27,7 @@ def _new_webcam_client(monkeypatch, tmp_path, webcam_token=""):
     monkeypatch.setenv("MIO_WEBCAM_CONTROL_PLANE_AUTH_TOKEN", webcam_token)
     monkeypatch.setenv("MOCK_CAMERA", "true")
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(0, str(workspace_root))
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-        return main.create_webcam_app(main._load_config()).test_client()
-    finally:
-        sys.path = original_sys_path
+    return main.create_webcam_app(main._load_config()).test_client()
 
 
 def _assert_version_payload_shape(payload: dict) -> None:
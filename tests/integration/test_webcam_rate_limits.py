@@ -1,11 +1,6 @@
 """Integration tests for webcam-mode request rate limits."""
 
-import importlib
-import sys
-from pathlib import Path
-
-
-workspace_root = Path(__file__).resolve().parents[2]
+from pi_camera_in_docker import main
 
 
 def _new_webcam_client(monkeypatch, tmp_path):
@@ -16,14 +11,7 @@ def _new_webcam_client(monkeypatch, tmp_path):
     monkeypatch.setenv("MIO_MAX_STREAM_CONNECTIONS", "1000")
     monkeypatch.setenv("MIO_WEBCAM_CONTROL_PLANE_AUTH_TOKEN", "")
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(0, str(workspace_root))
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-        return main.create_webcam_app(main._load_config()).test_client()
-    finally:
-        sys.path = original_sys_path
+    return main.create_webcam_app(main._load_config()).test_client()
 
 
 class TestWebcamRouteRateLimitsIntegration:
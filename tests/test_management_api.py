@@ -1,111 +1,295 @@
-import importlib
+import contextlib
+import functools
+import io
+import ipaddress
 import json
 import socket
 import ssl
-import sys
 import threading
 from datetime import datetime, timezone
-from pathlib import Path
 
 import pytest
-from flask import Flask
+from flask import Flask, Response
+from werkzeug.test import TestResponse
+
+from pi_camera_in_docker import management_api, shared
+from pi_camera_in_docker.node_registry import (
+    FileWebcamRegistry,
+    NodeValidationError,
+    validate_webcam,
+)
 
 
-# Import workspace root path (WORKSPACE_ROOT is set in conftest.py)
-# For module-level imports
-workspace_root = Path(__file__).parent.parent
+# Authorization headers for the management token set by _set_management_env.
+_AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+_INVALID_AUTH_HEADERS = {"Authorization": "Bearer invalid-token"}
 
 
-def _new_management_client(monkeypatch, tmp_path, management_token="test-token", webcam_token=""):
-    # SET THIS FIRST - before any other monkeypatches to ensure ApplicationSettings reads from tmp_path
+def _set_management_env(monkeypatch, data_dir, management_token="test-token", webcam_token=""):
+    # SET THIS FIRST - before any other monkeypatches to ensure ApplicationSettings reads from data_dir
     monkeypatch.setenv(
         "MIO_APPLICATION_SETTINGS_PATH",
-        str(tmp_path / "application-settings.json"),
+        str(data_dir / "application-settings.json"),
     )
 
     monkeypatch.setenv("MIO_APP_MODE", "management")
-    monkeypatch.setenv("MIO_NODE_REGISTRY_PATH", str(tmp_path / "registry.json"))
+    monkeypatch.setenv("MIO_NODE_REGISTRY_PATH", str(data_dir / "registry.json"))
     monkeypatch.setenv("MIO_MANAGEMENT_AUTH_TOKEN", management_token)
     monkeypatch.setenv("MIO_WEBCAM_CONTROL_PLANE_AUTH_TOKEN", webcam_token)
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(
-        0, str(workspace_root)
-    )  # Add the parent directory of pi_camera_in_docker to sys.path
-    try:
-        # Clear existing modules to ensure fresh import with new path
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        sys.modules.pop("pi_camera_in_docker.management_api", None)
-        # Import as a package module
-        main = importlib.import_module("pi_camera_in_docker.main")
-        management_api = importlib.import_module("pi_camera_in_docker.management_api")
-        client = main.create_management_app(main._load_config()).test_client()
-        return client, management_api
-    finally:
-        sys.path = original_sys_path
 
+class _TestResponse(TestResponse, Response):
+    """Test response that parses its JSON body once rather than on every ``.json`` access."""
 
-def _new_webcam_contract_client(auth_token=""):
-    from pi_camera_in_docker import shared
+    @functools.cached_property
+    def json(self):
+        return self.get_json()
 
-    app = Flask(__name__)
-    state = {
-        "app_mode": "webcam",
-        "recording_started": threading.Event(),
-        "max_frame_age_seconds": 10.0,
-        "max_stream_connections": 8,
-        "connection_tracker": None,
+
+def _test_client(app):
+    client = app.test_client()
+    client.response_wrapper = _TestResponse
+    return client
+
+
+def _new_management_client(
+    monkeypatch, tmp_path, main_module, management_token="test-token", webcam_token=""
+):
+    _set_management_env(monkeypatch, tmp_path, management_token, webcam_token)
+
+    # Config is read by _load_config(), so the session-wide main import is reusable.
+    client = _test_client(main_module.create_management_app(main_module._load_config()))
+    return client, management_api
+
+
+# Registry documents held by _InMemoryWebcamRegistry, keyed by registry path.
+_REGISTRY_DOCUMENTS = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+class _InMemoryWebcamRegistry(FileWebcamRegistry):
+    """``FileWebcamRegistry`` that keeps its JSON document in memory instead of on disk."""
+
+    def _load(self):
+        document = _REGISTRY_DOCUMENTS.get(self.path)
+        if document is None:
+            return {"nodes": []}
+        # Normalize nodes on every read, as FileWebcamRegistry._load does.
+        nodes = []
+        for index, webcam in enumerate(json.loads(document)["nodes"]):
+            if not isinstance(webcam, dict):
+                message = f"webcam at index {index} must be an object"
+                raise NodeValidationError(message)
+            nodes.append(validate_webcam(dict(webcam)))
+        return {"nodes": nodes}
+
+    def _save(self, data):
+        _REGISTRY_DOCUMENTS[self.path] = json.dumps(data)
+
+    @contextlib.contextmanager
+    def _exclusive_lock(self):
+        with _REGISTRY_LOCK:
+            yield
+
+
+@pytest.fixture(scope="module")
+def management_data_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("management")
+
+
+@pytest.fixture(scope="module")
+def management_app(management_data_dir, main_module):
+    """Management app with the default tokens, built once per module.
+
+    Testing mode is on, so unexpected exceptions propagate to the test instead of becoming
+    generic 500 responses. The management environment stays applied until the module finishes, so request-time env
+    reads see the same values the app was built with.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        _set_management_env(mp, management_data_dir)
+        with pytest.MonkeyPatch.context() as registry_mp:
+            registry_mp.setattr(management_api, "FileWebcamRegistry", _InMemoryWebcamRegistry)
+            app = main_module.create_management_app(main_module._load_config())
+        app.testing = True
+        yield app
+
+
+@pytest.fixture
+def client(management_app, management_data_dir):
+    """Test client for the shared management app, with registry, settings and limits reset."""
+    _REGISTRY_DOCUMENTS.clear()
+    (management_data_dir / "application-settings.json").unlink(missing_ok=True)
+    for limiter in management_app.extensions.get("limiter", ()):
+        limiter.reset()
+    return _test_client(management_app)
+
+
+# Registered nodes only need a well-formed timestamp; a fixed one keeps failure diffs stable.
+_NODE_LAST_SEEN = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc).isoformat()
+
+
+def _node_payload(**overrides):
+    """Build a webcam registration payload, overriding any of the default fields."""
+    base = {
+        "auth": {"type": "none"},
+        "labels": {},
+        "last_seen": _NODE_LAST_SEEN,
+        "capabilities": ["stream"],
+        "transport": "http",
     }
+    return {**base, **overrides}
+
+
+@pytest.fixture
+def node_payload():
+    """Factory for webcam registration payloads; see ``_node_payload``."""
+    return _node_payload
+
+
+@pytest.fixture
+def registered_node(client, management_data_dir, node_payload):
+    """Create webcams in the shared app's registry directly, skipping the HTTP create path."""
+    registry = _InMemoryWebcamRegistry(str(management_data_dir / "registry.json"))
+
+    def _register(**overrides):
+        overrides.setdefault("discovery", management_api._manual_discovery_defaults())
+        return registry.create_webcam(node_payload(**overrides))
+
+    return _register
+
+
+@pytest.fixture
+def upstream(monkeypatch, fake_upstream):
+    """Install ``fake_upstream`` as ``management_api._request_json`` and return it."""
+    monkeypatch.setattr(management_api, "_request_json", fake_upstream)
+    return fake_upstream
+
+
+def _addrinfo(*ips, port=80):
+    """Return a ``socket.getaddrinfo`` result listing ``ips`` as TCP/IPv4 entries."""
+    return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", (ip, port)) for ip in ips]
+
+
+@pytest.fixture(autouse=True)
+def _no_dns(monkeypatch):
+    """Resolve hostnames to a fixed public address so no test reaches real DNS.
+
+    IP literals resolve to themselves. Tests that need other answers patch ``getaddrinfo``
+    again themselves.
+    """
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return _addrinfo("93.184.216.34", port=port)
+        family = socket.AF_INET6 if address.version == 6 else socket.AF_INET
+        return [(family, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", (str(address), port))]
+
+    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
+
+
+class _UnexpectedConnection:
+    def __init__(self, host, port, connect_host, timeout, context=None):
+        message = f"test opened a real upstream connection to {host}:{port} via {connect_host}"
+        raise AssertionError(message)
+
+
+@pytest.fixture(autouse=True)
+def _no_upstream_connections(monkeypatch):
+    """Fail loudly if a test reaches a webcam without faking the pinned connection."""
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", _UnexpectedConnection)
+    monkeypatch.setattr(management_api, "_PinnedHTTPSConnection", _UnexpectedConnection)
+
+
+class _FakeHTTPResponse:
+    """Minimal ``http.client.HTTPResponse`` stand-in serving a fixed ``body``."""
+
+    status = 200
+    body = b""
+
+    def __init__(self, body=None, status=None):
+        if body is not None:
+            self.body = body
+        if status is not None:
+            self.status = status
+        self.length = len(self.body)
+        self._stream = io.BytesIO(self.body)
+
+    def readinto(self, buffer):
+        return self._stream.readinto(buffer)
+
+
+_WEBCAM_CONTRACT_STATE = {
+    "app_mode": "webcam",
+    "max_frame_age_seconds": 10.0,
+    "max_stream_connections": 8,
+    "connection_tracker": None,
+}
+
+
+def _new_webcam_contract_app(state, auth_token=""):
+    app = Flask(__name__)
     shared.register_webcam_control_plane_auth(app, auth_token, lambda: "webcam")
     shared.register_shared_routes(
         app, state, get_stream_status=lambda: {"current_fps": 0.0, "last_frame_age_seconds": None}
     )
-    return app.test_client()
+    return app
 
 
-def test_api_status_returns_current_api_test_scenario_when_inactive():
-    from pi_camera_in_docker import shared
+def _webcam_contract_state():
+    return {**_WEBCAM_CONTRACT_STATE, "recording_started": threading.Event()}
 
-    app = Flask(__name__)
-    state = {
-        "app_mode": "webcam",
-        "recording_started": threading.Event(),
-        "max_frame_age_seconds": 10.0,
-        "max_stream_connections": 8,
-        "connection_tracker": None,
-        "api_test": {
-            "enabled": True,
-            "active": False,
-            "lock": threading.RLock(),
-            "scenario_list": [
-                {
-                    "status": "ok",
-                    "stream_available": True,
-                    "camera_active": True,
-                    "fps": 30.0,
-                    "connections": {"current": 2, "max": 8},
-                },
-                {
-                    "status": "degraded",
-                    "stream_available": False,
-                    "camera_active": False,
-                    "fps": 0.0,
-                    "connections": {"current": 0, "max": 8},
-                },
-            ],
-            "current_state_index": 1,
-            "cycle_interval_seconds": 0.01,
-            "last_transition_monotonic": 0.0,
-        },
+
+def _new_webcam_contract_client(auth_token=""):
+    return _new_webcam_contract_app(_webcam_contract_state(), auth_token).test_client()
+
+
+@pytest.fixture(scope="module")
+def webcam_contract_app():
+    """Webcam shared-route app without auth, built once per module around a mutable state."""
+    state = {}
+    return _new_webcam_contract_app(state), state
+
+
+@pytest.fixture
+def webcam_contract(webcam_contract_app):
+    """Client and state for the shared webcam app, with state reset to the baseline."""
+    app, state = webcam_contract_app
+    state.clear()
+    state.update(_webcam_contract_state())
+    return _test_client(app), state
+
+
+def test_api_status_returns_current_api_test_scenario_when_inactive(webcam_contract):
+    client, state = webcam_contract
+    state["api_test"] = {
+        "enabled": True,
+        "active": False,
+        "lock": threading.RLock(),
+        "scenario_list": [
+            {
+                "status": "ok",
+                "stream_available": True,
+                "camera_active": True,
+                "fps": 30.0,
+                "connections": {"current": 2, "max": 8},
+            },
+            {
+                "status": "degraded",
+                "stream_available": False,
+                "camera_active": False,
+                "fps": 0.0,
+                "connections": {"current": 0, "max": 8},
+            },
+        ],
+        "current_state_index": 1,
+        "cycle_interval_seconds": 0.01,
+        "last_transition_monotonic": 0.0,
     }
 
-    shared.register_shared_routes(
-        app,
-        state,
-        get_stream_status=lambda: {"current_fps": 0.0, "last_frame_age_seconds": None},
-    )
-    response = app.test_client().get("/api/status")
+    response = client.get("/api/status")
 
     assert response.status_code == 200
     payload = response.get_json()
@@ -120,42 +304,28 @@ def test_api_status_returns_current_api_test_scenario_when_inactive():
     assert state["api_test"]["current_state_index"] == 1
 
 
-def test_api_status_skips_malformed_api_test_scenario_in_shared_route():
-    from pi_camera_in_docker import shared
-
-    app = Flask(__name__)
-    state = {
-        "app_mode": "webcam",
-        "recording_started": threading.Event(),
-        "max_frame_age_seconds": 10.0,
-        "max_stream_connections": 8,
-        "connection_tracker": None,
-        "api_test": {
-            "enabled": True,
-            "active": False,
-            "lock": threading.RLock(),
-            "scenario_list": [
-                {
-                    "status": "ok",
-                    "stream_available": True,
-                    "camera_active": True,
-                    "fps": 30.0,
-                    # Missing connections.current to verify defensive handling
-                    "connections": {"max": 8},
-                }
-            ],
-            "current_state_index": 0,
-            "cycle_interval_seconds": 1.0,
-            "last_transition_monotonic": 0.0,
-        },
+def test_api_status_skips_malformed_api_test_scenario_in_shared_route(webcam_contract):
+    client, state = webcam_contract
+    state["api_test"] = {
+        "enabled": True,
+        "active": False,
+        "lock": threading.RLock(),
+        "scenario_list": [
+            {
+                "status": "ok",
+                "stream_available": True,
+                "camera_active": True,
+                "fps": 30.0,
+                # Missing connections.current to verify defensive handling
+                "connections": {"max": 8},
+            }
+        ],
+        "current_state_index": 0,
+        "cycle_interval_seconds": 1.0,
+        "last_transition_monotonic": 0.0,
     }
 
-    shared.register_shared_routes(
-        app,
-        state,
-        get_stream_status=lambda: {"current_fps": 0.0, "last_frame_age_seconds": None},
-    )
-    response = app.test_client().get("/api/status")
+    response = client.get("/api/status")
 
     assert response.status_code == 200
     payload = response.get_json()
@@ -164,17 +334,19 @@ def test_api_status_skips_malformed_api_test_scenario_in_shared_route():
     assert "api_test" not in payload
 
 
-def test_api_status_skips_malformed_api_test_scenario_in_webcam_app(monkeypatch, tmp_path):
+def test_api_status_skips_malformed_api_test_scenario_in_webcam_app(
+    monkeypatch, tmp_path, main_module
+):
     monkeypatch.setenv("MIO_APPLICATION_SETTINGS_PATH", str(tmp_path / "application-settings.json"))
     monkeypatch.setenv("MIO_NODE_REGISTRY_PATH", str(tmp_path / "registry.json"))
     monkeypatch.setenv("MIO_APP_MODE", "webcam")
-    monkeypatch.setenv("MIO_MOCK_CAMERA", "true")
     monkeypatch.setenv("MIO_API_TEST_MODE_ENABLED", "true")
+    # Feature flags load once per process, so a re-import would not pick up MIO_MOCK_CAMERA.
+    monkeypatch.setattr(
+        main_module, "is_flag_enabled", lambda flag_name: {"MOCK_CAMERA": True}[flag_name]
+    )
 
-    sys.modules.pop("pi_camera_in_docker.main", None)
-    main = importlib.import_module("pi_camera_in_docker.main")
-
-    app = main.create_webcam_app(main._load_config())
+    app = main_module.create_webcam_app(main_module._load_config())
     app.motion_state["api_test"]["scenario_list"] = [
         {
             "status": "ok",
@@ -194,9 +366,8 @@ def test_api_status_skips_malformed_api_test_scenario_in_webcam_app(monkeypatch,
     assert "api_test" not in payload
 
 
-def test_settings_changes_endpoint_compares_resolution_values(monkeypatch, tmp_path):
+def test_settings_changes_endpoint_compares_resolution_values(monkeypatch, client):
     monkeypatch.setenv("MIO_RESOLUTION", "1280x720")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     save_response = client.patch(
         "/api/v1/settings",
@@ -216,9 +387,8 @@ def test_settings_changes_endpoint_compares_resolution_values(monkeypatch, tmp_p
     } in overridden
 
 
-def test_settings_changes_endpoint_handles_invalid_resolution_env(monkeypatch, tmp_path):
+def test_settings_changes_endpoint_handles_invalid_resolution_env(monkeypatch, client):
     monkeypatch.setenv("MIO_RESOLUTION", "invalid")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     save_response = client.patch(
         "/api/v1/settings",
@@ -238,13 +408,12 @@ def test_settings_changes_endpoint_handles_invalid_resolution_env(monkeypatch, t
     } in overridden
 
 
-def test_settings_changes_endpoint_handles_invalid_numeric_env(monkeypatch, tmp_path):
+def test_settings_changes_endpoint_handles_invalid_numeric_env(monkeypatch, client):
     monkeypatch.setenv("MIO_FPS", "invalid-fps")
     monkeypatch.setenv("MIO_JPEG_QUALITY", "invalid-jpeg")
     monkeypatch.setenv("MIO_MAX_STREAM_CONNECTIONS", "invalid-connections")
     monkeypatch.setenv("MIO_MAX_FRAME_AGE_SECONDS", "invalid-age")
     monkeypatch.setenv("MIO_DISCOVERY_INTERVAL_SECONDS", "invalid-interval")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     save_response = client.patch(
         "/api/v1/settings",
@@ -286,9 +455,7 @@ def test_settings_changes_endpoint_handles_invalid_numeric_env(monkeypatch, tmp_
     assert by_key[("discovery", "discovery_interval_seconds")]["env_value"] == 30
 
 
-def test_settings_patch_rejects_malformed_json(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
+def test_settings_patch_rejects_malformed_json(client):
     response = client.patch(
         "/api/v1/settings",
         data='{"camera": {"fps": 30',
@@ -303,9 +470,7 @@ def test_settings_patch_rejects_malformed_json(monkeypatch, tmp_path):
 
 
 @pytest.mark.parametrize("payload", [["camera"], "camera", 123])
-def test_settings_patch_rejects_non_object_json_payload(monkeypatch, tmp_path, payload):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
+def test_settings_patch_rejects_non_object_json_payload(payload, client):
     response = client.patch("/api/v1/settings", json=payload)
 
     assert response.status_code == 400
@@ -315,9 +480,7 @@ def test_settings_patch_rejects_non_object_json_payload(monkeypatch, tmp_path, p
     }
 
 
-def test_settings_patch_rejects_empty_object_payload(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
+def test_settings_patch_rejects_empty_object_payload(client):
     response = client.patch("/api/v1/settings", json={})
 
     assert response.status_code == 400
@@ -327,9 +490,7 @@ def test_settings_patch_rejects_empty_object_payload(monkeypatch, tmp_path):
     }
 
 
-def test_settings_patch_rejects_invalid_category_shape(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
+def test_settings_patch_rejects_invalid_category_shape(client):
     response = client.patch("/api/v1/settings", json={"camera": 123})
 
     assert response.status_code == 400
@@ -352,10 +513,8 @@ def test_settings_patch_rejects_invalid_category_shape(monkeypatch, tmp_path):
     ],
 )
 def test_settings_patch_rejects_invalid_property_value_type_or_range(
-    monkeypatch, tmp_path, payload, expected_errors
+    payload, expected_errors, client
 ):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
     response = client.patch("/api/v1/settings", json=payload)
 
     assert response.status_code == 400
@@ -365,9 +524,7 @@ def test_settings_patch_rejects_invalid_property_value_type_or_range(
     }
 
 
-def test_settings_patch_rejects_unknown_category_and_property(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
+def test_settings_patch_rejects_unknown_category_and_property(client):
     response = client.patch(
         "/api/v1/settings",
         json={
@@ -386,9 +543,7 @@ def test_settings_patch_rejects_unknown_category_and_property(monkeypatch, tmp_p
     }
 
 
-def test_settings_patch_response_reflects_persisted_state(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
+def test_settings_patch_response_reflects_persisted_state(client):
     before = client.get("/api/v1/settings")
     assert before.status_code == 200
     before_payload = before.get_json()
@@ -410,9 +565,7 @@ def test_settings_patch_response_reflects_persisted_state(monkeypatch, tmp_path)
     assert payload["last_modified"] != before_payload["last_modified"]
 
 
-def test_settings_patch_requires_restart_response_reflects_persisted_state(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
+def test_settings_patch_requires_restart_response_reflects_persisted_state(client):
     before = client.get("/api/v1/settings")
     assert before.status_code == 200
     before_payload = before.get_json()
@@ -436,7 +589,7 @@ def test_settings_patch_requires_restart_response_reflects_persisted_state(monke
     assert payload["last_modified"] != before_payload["last_modified"]
 
 
-def test_settings_endpoint_returns_effective_runtime_values(monkeypatch, tmp_path):
+def test_settings_endpoint_returns_effective_runtime_values(monkeypatch, client):
     monkeypatch.setenv("MIO_RESOLUTION", "1280x720")
     monkeypatch.setenv("MIO_FPS", "24")
     monkeypatch.setenv("MIO_JPEG_QUALITY", "88")
@@ -450,8 +603,6 @@ def test_settings_endpoint_returns_effective_runtime_values(monkeypatch, tmp_pat
     monkeypatch.setenv("MIO_DISCOVERY_TOKEN", "env-token")
     monkeypatch.setenv("MIO_DISCOVERY_INTERVAL_SECONDS", "45")
 
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
     patch_response = client.patch(
         "/api/v1/settings",
         json={
@@ -491,9 +642,11 @@ def test_settings_endpoint_returns_effective_runtime_values(monkeypatch, tmp_pat
     }
 
 
-def test_settings_patch_concurrent_overlapping_updates_are_merged(monkeypatch, tmp_path):
-    client_a, _ = _new_management_client(monkeypatch, tmp_path)
-    client_b, _ = _new_management_client(monkeypatch, tmp_path)
+def test_settings_patch_concurrent_overlapping_updates_are_merged(
+    monkeypatch, tmp_path, main_module
+):
+    client_a, _ = _new_management_client(monkeypatch, tmp_path, main_module)
+    client_b, _ = _new_management_client(monkeypatch, tmp_path, main_module)
 
     start = threading.Barrier(2)
     statuses = []
@@ -524,7 +677,7 @@ def test_settings_patch_concurrent_overlapping_updates_are_merged(monkeypatch, t
     assert len(statuses) == 2
     assert all(status in (200, 422) for status in statuses)
 
-    final_client, _ = _new_management_client(monkeypatch, tmp_path)
+    final_client, _ = _new_management_client(monkeypatch, tmp_path, main_module)
     final_response = final_client.get("/api/v1/settings")
     assert final_response.status_code == 200
     final_settings = final_response.get_json()["settings"]["camera"]
@@ -533,8 +686,6 @@ def test_settings_patch_concurrent_overlapping_updates_are_merged(monkeypatch, t
 
 
 def test_load_allow_private_ips_flag_canonical_only(monkeypatch):
-    from pi_camera_in_docker import management_api
-
     monkeypatch.setenv("MIO_ALLOW_PRIVATE_IPS", "true")
     monkeypatch.delenv("MOTION_IN_OCEAN_ALLOW_PRIVATE_IPS", raising=False)
 
@@ -542,8 +693,6 @@ def test_load_allow_private_ips_flag_canonical_only(monkeypatch):
 
 
 def test_load_allow_private_ips_flag_legacy_only(monkeypatch, caplog):
-    from pi_camera_in_docker import management_api
-
     monkeypatch.delenv("MIO_ALLOW_PRIVATE_IPS", raising=False)
     monkeypatch.setenv("MOTION_IN_OCEAN_ALLOW_PRIVATE_IPS", "yes")
 
@@ -556,28 +705,20 @@ def test_load_allow_private_ips_flag_legacy_only(monkeypatch, caplog):
 
 
 def test_load_allow_private_ips_flag_canonical_wins_over_legacy(monkeypatch):
-    from pi_camera_in_docker import management_api
-
     monkeypatch.setenv("MIO_ALLOW_PRIVATE_IPS", "false")
     monkeypatch.setenv("MOTION_IN_OCEAN_ALLOW_PRIVATE_IPS", "true")
 
     assert management_api._load_allow_private_ips_flag() is False
 
 
-def _auth_headers(token="test-token"):
-    return {"Authorization": f"Bearer {token}"}
-
-
 def test_manual_discovery_defaults_handles_malformed_discovery_metadata():
-    from pi_camera_in_docker.management_api import _manual_discovery_defaults
-
     for malformed_discovery in ([], "invalid", None):
         existing = {
             "last_seen": "2024-01-01T00:00:00+00:00",
             "discovery": malformed_discovery,
         }
 
-        result = _manual_discovery_defaults(existing)
+        result = management_api._manual_discovery_defaults(existing)
 
         assert result == {
             "source": "manual",
@@ -588,10 +729,8 @@ def test_manual_discovery_defaults_handles_malformed_discovery_metadata():
 
 
 def test_discovery_metadata_handles_malformed_discovery_metadata(monkeypatch):
-    from pi_camera_in_docker.management_api import _discovery_metadata
-
     fixed_now = "2024-02-02T00:00:00+00:00"
-    monkeypatch.setattr("pi_camera_in_docker.management_api._utc_now_iso", lambda: fixed_now)
+    monkeypatch.setattr(management_api, "_utc_now_iso", lambda: fixed_now)
 
     for malformed_discovery in ([], "invalid", None):
         existing = {
@@ -599,7 +738,7 @@ def test_discovery_metadata_handles_malformed_discovery_metadata(monkeypatch):
             "discovery": malformed_discovery,
         }
 
-        result = _discovery_metadata(existing)
+        result = management_api._discovery_metadata(existing)
 
         assert result == {
             "source": "discovered",
@@ -609,88 +748,66 @@ def test_discovery_metadata_handles_malformed_discovery_metadata(monkeypatch):
         }
 
 
-def test_node_crud_and_overview(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-1",
-        "name": "Front Door",
-        "base_url": "http://127.0.0.1:65534",
-        "auth": {"type": "none"},
-        "labels": {"location": "entry"},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream", "metrics"],
-        "transport": "http",
-    }
+def test_node_crud_and_overview(client, node_payload):
+    payload = node_payload(
+        id="node-1",
+        name="Front Door",
+        base_url="http://127.0.0.1:65534",
+        labels={"location": "entry"},
+        capabilities=["stream", "metrics"],
+    )
 
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
+    created = client.post("/api/v1/webcams", json=payload, headers=_AUTH_HEADERS)
     assert created.status_code == 201
     assert created.json["id"] == "node-1"
     assert created.json["discovery"]["source"] == "manual"
     assert created.json["discovery"]["approved"] is True
 
-    listed = client.get("/api/v1/webcams", headers=_auth_headers())
+    listed = client.get("/api/v1/webcams", headers=_AUTH_HEADERS)
     assert listed.status_code == 200
     assert len(listed.json["webcams"]) == 1
 
     updated = client.put(
-        "/api/v1/webcams/node-1", json={"name": "Front Door Cam"}, headers=_auth_headers()
+        "/api/v1/webcams/node-1", json={"name": "Front Door Cam"}, headers=_AUTH_HEADERS
     )
     assert updated.status_code == 200
     assert updated.json["name"] == "Front Door Cam"
 
-    status = client.get("/api/v1/webcams/node-1/status", headers=_auth_headers())
+    status = client.get("/api/v1/webcams/node-1/status", headers=_AUTH_HEADERS)
     assert status.status_code == 503
     assert status.json["error"]["code"] == "SSRF_BLOCKED"
 
-    overview = client.get("/api/v1/management/overview", headers=_auth_headers())
+    overview = client.get("/api/v1/management/overview", headers=_AUTH_HEADERS)
     assert overview.status_code == 200
     assert overview.json["summary"]["total_webcams"] == 1
     assert overview.json["summary"]["unavailable_webcams"] == 1
     assert overview.json["summary"]["healthy_webcams"] == 0
 
-    deleted = client.delete("/api/v1/webcams/node-1", headers=_auth_headers())
+    deleted = client.delete("/api/v1/webcams/node-1", headers=_AUTH_HEADERS)
     assert deleted.status_code == 204
 
 
-def test_validation_and_transport_errors(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    invalid = client.post("/api/v1/webcams", json={"id": "only-id"}, headers=_auth_headers())
+def test_validation_and_transport_errors(client, node_payload):
+    invalid = client.post("/api/v1/webcams", json={"id": "only-id"}, headers=_AUTH_HEADERS)
     assert invalid.status_code == 400
     assert invalid.json["error"]["code"] == "VALIDATION_ERROR"
 
-    payload = {
-        "id": "node-2",
-        "name": "Docker Node",
-        "base_url": "docker://proxy:2375/container-id",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "docker",
-    }
-    assert (
-        client.post(
-            "/api/v1/webcams",
-            json=payload,
-            headers={"Authorization": "Bearer test-token"},
-        ).status_code
-        == 201
+    payload = node_payload(
+        id="node-2",
+        name="Docker Node",
+        base_url="docker://proxy:2375/container-id",
+        transport="docker",
     )
+    assert client.post("/api/v1/webcams", json=payload, headers=_AUTH_HEADERS).status_code == 201
 
-    invalid_docker_create = {
-        "id": "node-2-invalid",
-        "name": "Docker Node Invalid",
-        "base_url": "docker://proxy/container-id",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "docker",
-    }
+    invalid_docker_create = node_payload(
+        id="node-2-invalid",
+        name="Docker Node Invalid",
+        base_url="docker://proxy/container-id",
+        transport="docker",
+    )
     invalid_create = client.post(
-        "/api/v1/webcams", json=invalid_docker_create, headers=_auth_headers()
+        "/api/v1/webcams", json=invalid_docker_create, headers=_AUTH_HEADERS
     )
     assert invalid_create.status_code == 400
     assert invalid_create.json["error"]["code"] == "VALIDATION_ERROR"
@@ -699,31 +816,22 @@ def test_validation_and_transport_errors(monkeypatch, tmp_path):
     invalid_update = client.put(
         "/api/v1/webcams/node-2",
         json={"base_url": "docker://proxy:2375"},
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert invalid_update.status_code == 400
     assert invalid_update.json["error"]["code"] == "VALIDATION_ERROR"
     assert "docker URL must include container ID" in invalid_update.json["error"]["message"]
 
-    action = client.post("/api/v1/webcams/node-2/actions/restart", json={}, headers=_auth_headers())
+    action = client.post("/api/v1/webcams/node-2/actions/restart", json={}, headers=_AUTH_HEADERS)
     assert action.status_code == 400
     assert action.json["error"]["code"] == "TRANSPORT_UNSUPPORTED"
 
 
-def test_update_webcam_rejects_malformed_json(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-malformed-update",
-        "name": "Malformed Update",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
+def test_update_webcam_rejects_malformed_json(client, node_payload):
+    payload = node_payload(
+        id="node-malformed-update", name="Malformed Update", base_url="http://example.com"
+    )
+    created = client.post("/api/v1/webcams", json=payload, headers=_AUTH_HEADERS)
     assert created.status_code == 201
     assert created.json["discovery"] == {
         "source": "manual",
@@ -736,7 +844,7 @@ def test_update_webcam_rejects_malformed_json(monkeypatch, tmp_path):
         "/api/v1/webcams/node-malformed-update",
         data='{"name": "broken"',
         content_type="application/json",
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
 
     assert response.status_code == 400
@@ -744,51 +852,36 @@ def test_update_webcam_rejects_malformed_json(monkeypatch, tmp_path):
     assert "valid JSON" in response.json["error"]["message"]
     assert response.json["error"]["webcam_id"] == "node-malformed-update"
 
-    fetched = client.get("/api/v1/webcams/node-malformed-update", headers=_auth_headers())
+    fetched = client.get("/api/v1/webcams/node-malformed-update", headers=_AUTH_HEADERS)
     assert fetched.status_code == 200
     assert fetched.json["name"] == "Malformed Update"
     assert fetched.json["discovery"] == created.json["discovery"]
 
 
-def test_update_webcam_empty_object_keeps_discovery_fields(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-empty-update",
-        "name": "Empty Update",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
+def test_update_webcam_empty_object_keeps_discovery_fields(client, node_payload):
+    payload = node_payload(
+        id="node-empty-update", name="Empty Update", base_url="http://example.com"
+    )
+    created = client.post("/api/v1/webcams", json=payload, headers=_AUTH_HEADERS)
     assert created.status_code == 201
 
     before = created.json["discovery"]
-    response = client.put("/api/v1/webcams/node-empty-update", json={}, headers=_auth_headers())
+    response = client.put("/api/v1/webcams/node-empty-update", json={}, headers=_AUTH_HEADERS)
 
     assert response.status_code == 200
     assert response.json["id"] == "node-empty-update"
     assert response.json["discovery"] == before
 
 
-def test_create_node_rejects_unmigratable_legacy_basic_auth(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-legacy-auth",
-        "name": "Legacy Auth",
-        "base_url": "http://example.com",
-        "auth": {"type": "basic", "username": "camera", "password": "secret"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
+def test_create_node_rejects_unmigratable_legacy_basic_auth(client, node_payload):
+    payload = node_payload(
+        id="node-legacy-auth",
+        name="Legacy Auth",
+        base_url="http://example.com",
+        auth={"type": "basic", "username": "camera", "password": "secret"},
+    )
 
-    response = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
+    response = client.post("/api/v1/webcams", json=payload, headers=_AUTH_HEADERS)
     assert response.status_code == 400
     assert response.json["error"]["code"] == "VALIDATION_ERROR"
     assert (
@@ -797,126 +890,47 @@ def test_create_node_rejects_unmigratable_legacy_basic_auth(monkeypatch, tmp_pat
     )
 
 
-def test_ssrf_protection_blocks_local_targets(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-3",
-        "name": "Internal Node",
-        "base_url": "http://127.0.0.1:8080",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["metrics"],
-        "transport": "http",
-    }
-    assert (
-        client.post(
-            "/api/v1/webcams",
-            json=payload,
-            headers={"Authorization": "Bearer test-token"},
-        ).status_code
-        == 201
-    )
+@pytest.mark.parametrize(
+    ("node_id", "name", "base_url"),
+    [
+        ("node-3", "Internal Node", "http://127.0.0.1:8080"),
+        ("node-4", "Mapped Loopback", "http://[::ffff:127.0.0.1]:8080"),
+        ("node-5", "Metadata Target", "http://169.254.169.254"),
+    ],
+    ids=["ipv4-loopback", "ipv6-mapped-loopback", "metadata-ip"],
+)
+def test_ssrf_protection_blocks_local_targets(client, registered_node, node_id, name, base_url):
+    registered_node(id=node_id, name=name, base_url=base_url, capabilities=["metrics"])
 
-    status = client.get("/api/v1/webcams/node-3/status", headers=_auth_headers())
+    status = client.get(f"/api/v1/webcams/{node_id}/status", headers=_AUTH_HEADERS)
     assert status.status_code == 503
     assert status.json["error"]["code"] == "SSRF_BLOCKED"
     assert "SSRF protection" in status.json["error"]["details"]["reason"]
     assert status.json["error"]["details"]["category"] == "ssrf_blocked"
 
 
-def test_corrupted_registry_file_returns_500_error_payload(monkeypatch, tmp_path):
-    registry_path = tmp_path / "registry.json"
-    registry_path.write_text("{invalid json", encoding="utf-8")
+def test_corrupted_registry_file_returns_500_error_payload(monkeypatch, tmp_path, main_module):
+    # Corruption detection lives in FileWebcamRegistry, so use a real file-backed app.
+    client, _ = _new_management_client(monkeypatch, tmp_path, main_module)
+    (tmp_path / "registry.json").write_text("{invalid json", encoding="utf-8")
 
-    monkeypatch.setenv("MIO_APP_MODE", "management")
-    monkeypatch.setenv("MIO_NODE_REGISTRY_PATH", str(registry_path))
-    monkeypatch.setenv("MIO_MANAGEMENT_AUTH_TOKEN", "test-token")
-    original_sys_path = sys.path.copy()
-    sys.path.insert(
-        0, str(workspace_root)
-    )  # Add the parent directory of pi_camera_in_docker to sys.path
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        sys.modules.pop("pi_camera_in_docker.management_api", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-        client = main.create_management_app(main._load_config()).test_client()
-    finally:
-        sys.path = original_sys_path
-
-    listed = client.get("/api/v1/webcams", headers=_auth_headers())
+    listed = client.get("/api/v1/webcams", headers=_AUTH_HEADERS)
     assert listed.status_code == 500
     assert listed.json["error"]["code"] == "REGISTRY_CORRUPTED"
     assert listed.json["error"]["details"]["reason"] == "invalid registry json"
 
-    overview = client.get("/api/v1/management/overview", headers=_auth_headers())
+    overview = client.get("/api/v1/management/overview", headers=_AUTH_HEADERS)
     assert overview.status_code == 500
     assert overview.json["error"]["code"] == "REGISTRY_CORRUPTED"
 
 
-def test_ssrf_protection_blocks_ipv6_mapped_loopback(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-4",
-        "name": "Mapped Loopback",
-        "base_url": "http://[::ffff:127.0.0.1]:8080",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["metrics"],
-        "transport": "http",
-    }
-    assert (
-        client.post(
-            "/api/v1/webcams",
-            json=payload,
-            headers={"Authorization": "Bearer test-token"},
-        ).status_code
-        == 201
-    )
-
-    status = client.get("/api/v1/webcams/node-4/status", headers=_auth_headers())
-    assert status.status_code == 503
-    assert status.json["error"]["code"] == "SSRF_BLOCKED"
-    assert "SSRF protection" in status.json["error"]["details"]["reason"]
-    assert status.json["error"]["details"]["category"] == "ssrf_blocked"
-
-
-def test_ssrf_protection_blocks_metadata_ip_literal(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-5",
-        "name": "Metadata Target",
-        "base_url": "http://169.254.169.254",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["metrics"],
-        "transport": "http",
-    }
-    assert (
-        client.post(
-            "/api/v1/webcams",
-            json=payload,
-            headers={"Authorization": "Bearer test-token"},
-        ).status_code
-        == 201
-    )
-
-    status = client.get("/api/v1/webcams/node-5/status", headers=_auth_headers())
-    assert status.status_code == 503
-    assert status.json["error"]["code"] == "SSRF_BLOCKED"
-    assert "SSRF protection" in status.json["error"]["details"]["reason"]
-    assert status.json["error"]["details"]["category"] == "ssrf_blocked"
-
-
-def test_management_endpoints_do_not_accept_webcam_control_plane_token(monkeypatch, tmp_path):
+def test_management_endpoints_do_not_accept_webcam_control_plane_token(
+    monkeypatch, tmp_path, main_module
+):
     client, _ = _new_management_client(
         monkeypatch,
         tmp_path,
+        main_module,
         management_token="management-only-token",
         webcam_token="webcam-only-token",
     )
@@ -927,20 +941,15 @@ def test_management_endpoints_do_not_accept_webcam_control_plane_token(monkeypat
     assert response.json["error"]["code"] == "UNAUTHORIZED"
 
 
-def test_docker_transport_allows_any_valid_token(monkeypatch, tmp_path):
+def test_docker_transport_allows_any_valid_token(monkeypatch, client, node_payload):
     monkeypatch.setenv("MANAGEMENT_AUTH_REQUIRED", "true")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
-    payload = {
-        "id": "node-docker-shared",
-        "name": "Docker Shared Access",
-        "base_url": "docker://proxy:2375/container-id",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "docker",
-    }
+    payload = node_payload(
+        id="node-docker-shared",
+        name="Docker Shared Access",
+        base_url="docker://proxy:2375/container-id",
+        transport="docker",
+    )
 
     unauthorized = client.post("/api/v1/webcams", json=payload)
     assert unauthorized.status_code == 401
@@ -949,7 +958,7 @@ def test_docker_transport_allows_any_valid_token(monkeypatch, tmp_path):
     invalid_token = client.post(
         "/api/v1/webcams",
         json=payload,
-        headers={"Authorization": "Bearer invalid-token"},
+        headers=_INVALID_AUTH_HEADERS,
     )
     assert invalid_token.status_code == 401
     assert invalid_token.json["error"]["code"] == "UNAUTHORIZED"
@@ -957,15 +966,15 @@ def test_docker_transport_allows_any_valid_token(monkeypatch, tmp_path):
     authorized = client.post(
         "/api/v1/webcams",
         json=payload,
-        headers={"Authorization": "Bearer test-token"},
+        headers=_AUTH_HEADERS,
     )
     assert authorized.status_code == 201
     assert authorized.json["id"] == "node-docker-shared"
 
 
-def test_update_node_returns_404_when_node_disappears_during_update(monkeypatch, tmp_path):
-    from pi_camera_in_docker import management_api
-
+def test_update_node_returns_404_when_node_disappears_during_update(
+    monkeypatch, client, registered_node
+):
     original_update_from_current = management_api.FileWebcamRegistry.update_webcam_from_current
 
     def flaky_update_node(self, webcam_id, patch_builder):
@@ -976,32 +985,18 @@ def test_update_node_returns_404_when_node_disappears_during_update(monkeypatch,
     monkeypatch.setattr(
         management_api.FileWebcamRegistry, "update_webcam_from_current", flaky_update_node
     )
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-race",
-        "name": "Race Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
 
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
+    registered_node(id="node-race", name="Race Node", base_url="http://example.com")
 
     response = client.put(
-        "/api/v1/webcams/node-race", json={"name": "Updated Name"}, headers=_auth_headers()
+        "/api/v1/webcams/node-race", json={"name": "Updated Name"}, headers=_AUTH_HEADERS
     )
     assert response.status_code == 404
     assert response.json["error"]["code"] == "WEBCAM_NOT_FOUND"
 
 
-def test_discovery_announce_creates_then_updates_node(monkeypatch, tmp_path):
+def test_discovery_announce_creates_then_updates_node(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     create_payload = {
         "webcam_id": "node-discovery-1",
@@ -1043,11 +1038,18 @@ def test_discovery_announce_creates_then_updates_node(monkeypatch, tmp_path):
     assert updated.json["node"]["discovery"]["last_announce_at"] != first_announce
 
 
-def test_discovery_announce_update_repairs_incomplete_discovery_metadata(monkeypatch, tmp_path):
+def test_discovery_announce_update_repairs_incomplete_discovery_metadata(
+    monkeypatch, client, registered_node
+):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
-    create_payload = {
+    registered_node(
+        id="node-discovery-incomplete-metadata",
+        name="Discovery Incomplete",
+        base_url="http://example.com",
+        discovery={"source": "discovered", "approved": True},
+    )
+    announce_payload = {
         "webcam_id": "node-discovery-incomplete-metadata",
         "name": "Discovery Incomplete",
         "base_url": "http://example.com",
@@ -1055,31 +1057,9 @@ def test_discovery_announce_update_repairs_incomplete_discovery_metadata(monkeyp
         "capabilities": ["stream"],
     }
 
-    created = client.post(
-        "/api/v1/discovery/announce",
-        json=create_payload,
-        headers={"Authorization": "Bearer discovery-secret"},
-    )
-    assert created.status_code == 201
-
-    approve = client.post(
-        "/api/v1/webcams/node-discovery-incomplete-metadata/discovery/approve",
-        headers=_auth_headers(),
-    )
-    assert approve.status_code == 200
-
-    registry_path = tmp_path / "registry.json"
-    registry_data = json.loads(registry_path.read_text())
-    node = registry_data["nodes"][0]
-    node["discovery"] = {
-        "source": "discovered",
-        "approved": True,
-    }
-    registry_path.write_text(json.dumps(registry_data, indent=2))
-
     updated = client.post(
         "/api/v1/discovery/announce",
-        json={**create_payload, "name": "Discovery Incomplete Updated"},
+        json={**announce_payload, "name": "Discovery Incomplete Updated"},
         headers={"Authorization": "Bearer discovery-secret"},
     )
     assert updated.status_code == 200
@@ -1088,10 +1068,15 @@ def test_discovery_announce_update_repairs_incomplete_discovery_metadata(monkeyp
     assert updated.json["node"]["discovery"]["last_announce_at"] is not None
     assert updated.json["node"]["discovery"]["approved"] is True
 
+    fetched = client.get(
+        "/api/v1/webcams/node-discovery-incomplete-metadata", headers=_AUTH_HEADERS
+    )
+    assert fetched.status_code == 200
+    assert fetched.json["discovery"] == updated.json["node"]["discovery"]
+
 
-def test_discovery_announce_parallel_requests_do_not_duplicate_error(monkeypatch, tmp_path):
+def test_discovery_announce_parallel_requests_do_not_duplicate_error(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-parallel",
@@ -1101,35 +1086,39 @@ def test_discovery_announce_parallel_requests_do_not_duplicate_error(monkeypatch
         "capabilities": ["stream"],
     }
 
-    barrier = threading.Barrier(2)
-    responses = []
-
-    def announce_once():
-        barrier.wait()
-        response = client.post(
+    def announce():
+        return client.post(
             "/api/v1/discovery/announce",
             json=payload,
             headers={"Authorization": "Bearer discovery-secret"},
         )
-        responses.append(response)
 
-    t1 = threading.Thread(target=announce_once)
-    t2 = threading.Thread(target=announce_once)
-    t1.start()
-    t2.start()
-    t1.join()
-    t2.join()
+    # Land a competing announcement after the first request has validated its payload but
+    # before it reaches the registry, reproducing the race without threads.
+    responses = []
+    raced = []
+    original_upsert_from_current = management_api.FileWebcamRegistry.upsert_webcam_from_current
+
+    def racing_upsert_from_current(self, webcam_id, create_value, patch_builder):
+        if not raced:
+            raced.append(True)
+            responses.append(announce())
+        return original_upsert_from_current(self, webcam_id, create_value, patch_builder)
+
+    monkeypatch.setattr(
+        management_api.FileWebcamRegistry, "upsert_webcam_from_current", racing_upsert_from_current
+    )
+    responses.append(announce())
 
-    statuses = sorted(response.status_code for response in responses)
-    assert statuses == [200, 201]
+    statuses = [response.status_code for response in responses]
+    assert statuses == [201, 200]
     assert all(
         response.json.get("error", {}).get("code") != "VALIDATION_ERROR" for response in responses
     )
 
 
-def test_discovery_announce_requires_bearer_token(monkeypatch, tmp_path):
+def test_discovery_announce_requires_bearer_token(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-2",
@@ -1152,10 +1141,9 @@ def test_discovery_announce_requires_bearer_token(monkeypatch, tmp_path):
     assert invalid.json["error"]["code"] == "UNAUTHORIZED"
 
 
-def test_discovery_announce_blocks_private_ip_without_opt_in(monkeypatch, tmp_path):
+def test_discovery_announce_blocks_private_ip_without_opt_in(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
     monkeypatch.delenv("MIO_ALLOW_PRIVATE_IPS", raising=False)
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-private-blocked",
@@ -1176,10 +1164,9 @@ def test_discovery_announce_blocks_private_ip_without_opt_in(monkeypatch, tmp_pa
     assert blocked.json["error"]["details"]["required_setting"] == "MIO_ALLOW_PRIVATE_IPS=true"
 
 
-def test_discovery_announce_allows_private_ip_with_opt_in(monkeypatch, tmp_path):
+def test_discovery_announce_allows_private_ip_with_opt_in(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
     monkeypatch.setenv("MIO_ALLOW_PRIVATE_IPS", "true")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-private-allowed",
@@ -1199,10 +1186,9 @@ def test_discovery_announce_allows_private_ip_with_opt_in(monkeypatch, tmp_path)
     assert created.json["node"]["id"] == "node-discovery-private-allowed"
 
 
-def test_discovery_announce_allows_hostname_with_mixed_resolved_addresses(monkeypatch, tmp_path):
+def test_discovery_announce_allows_hostname_with_mixed_resolved_addresses(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
     monkeypatch.delenv("MIO_ALLOW_PRIVATE_IPS", raising=False)
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-mixed-resolution",
@@ -1216,10 +1202,7 @@ def test_discovery_announce_allows_hostname_with_mixed_resolved_addresses(monkey
         assert host == "mixed-resolution.example"
         assert port == 8000
         assert proto == socket.IPPROTO_TCP
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("192.168.1.10", 8000)),
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("8.8.8.8", 8000)),
-        ]
+        return _addrinfo("192.168.1.10", "8.8.8.8", port=8000)
 
     monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
 
@@ -1233,10 +1216,9 @@ def test_discovery_announce_allows_hostname_with_mixed_resolved_addresses(monkey
     assert allowed.json["node"]["id"] == "node-discovery-mixed-resolution"
 
 
-def test_discovery_private_ip_policy_updates_between_requests(monkeypatch, tmp_path):
+def test_discovery_private_ip_policy_updates_between_requests(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
     monkeypatch.delenv("MIO_ALLOW_PRIVATE_IPS", raising=False)
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-toggle-policy",
@@ -1264,10 +1246,9 @@ def test_discovery_private_ip_policy_updates_between_requests(monkeypatch, tmp_p
     assert allowed.json["node"]["id"] == "node-discovery-toggle-policy"
 
 
-def test_discovery_announce_rejects_unresolved_hostname(monkeypatch, tmp_path):
+def test_discovery_announce_rejects_unresolved_hostname(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
     monkeypatch.delenv("MIO_ALLOW_PRIVATE_IPS", raising=False)
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-unresolved-host",
@@ -1300,11 +1281,10 @@ def test_discovery_announce_rejects_unresolved_hostname(monkeypatch, tmp_path):
 
 
 def test_discovery_announce_rejects_unresolved_hostname_when_private_ips_allowed(
-    monkeypatch, tmp_path
+    monkeypatch, client
 ):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
     monkeypatch.setenv("MIO_ALLOW_PRIVATE_IPS", "true")
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
 
     payload = {
         "webcam_id": "node-discovery-unresolved-host-private-enabled",
@@ -1335,9 +1315,8 @@ def test_discovery_announce_rejects_unresolved_hostname_when_private_ips_allowed
     )
 
 
-def test_discovery_announce_validates_payload(monkeypatch, tmp_path):
+def test_discovery_announce_validates_payload(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     invalid = client.post(
         "/api/v1/discovery/announce",
@@ -1348,9 +1327,8 @@ def test_discovery_announce_validates_payload(monkeypatch, tmp_path):
     assert invalid.json["error"]["code"] == "VALIDATION_ERROR"
 
 
-def test_discovery_announce_rejects_malformed_base_url_port_with_400(monkeypatch, tmp_path):
+def test_discovery_announce_rejects_malformed_base_url_port_with_400(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     invalid = client.post(
         "/api/v1/discovery/announce",
@@ -1368,9 +1346,8 @@ def test_discovery_announce_rejects_malformed_base_url_port_with_400(monkeypatch
     assert invalid.json["error"]["code"] == "VALIDATION_ERROR"
 
 
-def test_discovery_approval_endpoint(monkeypatch, tmp_path):
+def test_discovery_approval_endpoint(monkeypatch, client):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, _ = _new_management_client(monkeypatch, tmp_path)
 
     announce_payload = {
         "webcam_id": "node-discovery-approval",
@@ -1390,14 +1367,14 @@ def test_discovery_approval_endpoint(monkeypatch, tmp_path):
 
     approved = client.post(
         "/api/v1/webcams/node-discovery-approval/discovery/approve",
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert approved.status_code == 200
     assert approved.json["node"]["discovery"]["approved"] is True
 
     rejected = client.post(
         "/api/v1/webcams/node-discovery-approval/discovery/reject",
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert rejected.status_code == 200
     assert rejected.json["node"]["discovery"]["approved"] is False
@@ -1405,10 +1382,9 @@ def test_discovery_approval_endpoint(monkeypatch, tmp_path):
 
 @pytest.mark.parametrize("decision", ["approve", "reject"])
 def test_discovery_approval_returns_404_when_node_deleted_during_update(
-    monkeypatch, tmp_path, decision
+    monkeypatch, decision, client
 ):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
 
     announce_payload = {
         "webcam_id": "node-discovery-approval-delete-race",
@@ -1446,7 +1422,7 @@ def test_discovery_approval_returns_404_when_node_deleted_during_update(
     def do_approval():
         approval_response["response"] = client.post(
             f"/api/v1/webcams/node-discovery-approval-delete-race/discovery/{decision}",
-            headers=_auth_headers(),
+            headers=_AUTH_HEADERS,
         )
 
     approval_thread = threading.Thread(target=do_approval)
@@ -1454,7 +1430,7 @@ def test_discovery_approval_returns_404_when_node_deleted_during_update(
     update_started.wait(timeout=2)
 
     deleted = client.delete(
-        "/api/v1/webcams/node-discovery-approval-delete-race", headers=_auth_headers()
+        "/api/v1/webcams/node-discovery-approval-delete-race", headers=_AUTH_HEADERS
     )
     assert deleted.status_code == 204
 
@@ -1467,10 +1443,9 @@ def test_discovery_approval_returns_404_when_node_deleted_during_update(
 
 
 def test_discovery_announce_preserves_approved_state_when_approval_happens_before_upsert(
-    monkeypatch, tmp_path
+    monkeypatch, client
 ):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
 
     announce_payload = {
         "webcam_id": "node-discovery-approval-race-approve",
@@ -1518,7 +1493,7 @@ def test_discovery_announce_preserves_approved_state_when_approval_happens_befor
 
     approved = client.post(
         "/api/v1/webcams/node-discovery-approval-race-approve/discovery/approve",
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert approved.status_code == 200
     assert approved.json["node"]["discovery"]["approved"] is True
@@ -1532,10 +1507,9 @@ def test_discovery_announce_preserves_approved_state_when_approval_happens_befor
 
 
 def test_discovery_announce_preserves_rejected_state_when_rejection_happens_before_upsert(
-    monkeypatch, tmp_path
+    monkeypatch, client
 ):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
 
     announce_payload = {
         "webcam_id": "node-discovery-approval-race-reject",
@@ -1554,7 +1528,7 @@ def test_discovery_announce_preserves_rejected_state_when_rejection_happens_befo
 
     approved = client.post(
         "/api/v1/webcams/node-discovery-approval-race-reject/discovery/approve",
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert approved.status_code == 200
 
@@ -1589,7 +1563,7 @@ def test_discovery_announce_preserves_rejected_state_when_rejection_happens_befo
 
     rejected = client.post(
         "/api/v1/webcams/node-discovery-approval-race-reject/discovery/reject",
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert rejected.status_code == 200
     assert rejected.json["node"]["discovery"]["approved"] is False
@@ -1603,10 +1577,9 @@ def test_discovery_announce_preserves_rejected_state_when_rejection_happens_befo
 
 
 def test_discovery_approval_does_not_roll_back_last_announce_at_during_concurrent_announce(
-    monkeypatch, tmp_path
+    monkeypatch, client
 ):
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
 
     announce_payload = {
         "webcam_id": "node-discovery-last-announce-race",
@@ -1645,7 +1618,7 @@ def test_discovery_approval_does_not_roll_back_last_announce_at_during_concurren
     def do_approval():
         approval_response["response"] = client.post(
             "/api/v1/webcams/node-discovery-last-announce-race/discovery/approve",
-            headers=_auth_headers(),
+            headers=_AUTH_HEADERS,
         )
 
     approval_thread = threading.Thread(target=do_approval)
@@ -1669,33 +1642,36 @@ def test_discovery_approval_does_not_roll_back_last_announce_at_during_concurren
     assert approved.json["node"]["discovery"]["approved"] is True
     assert approved.json["node"]["discovery"]["last_announce_at"] == concurrent_last_announce
 
-    fetched = client.get(
-        "/api/v1/webcams/node-discovery-last-announce-race", headers=_auth_headers()
-    )
+    fetched = client.get("/api/v1/webcams/node-discovery-last-announce-race", headers=_AUTH_HEADERS)
     assert fetched.status_code == 200
     assert fetched.json["discovery"]["last_announce_at"] == concurrent_last_announce
 
 
-def test_request_json_sets_authorization_header_by_auth_mode(monkeypatch):
-    from pi_camera_in_docker import management_api
-
-    class FakeResponse:
-        status = 200
+_AUTH_HEADER_CASES = [
+    pytest.param(
+        {"type": "bearer", "token": "node-token"}, "Bearer node-token", id="bearer-with-token"
+    ),
+    pytest.param({"type": "bearer"}, None, id="bearer-without-token"),
+    pytest.param(
+        {"type": "basic", "encoded": "abc", "username": "camera", "password": "secret"},
+        None,
+        id="basic",
+    ),
+]
 
-        def __enter__(self):
-            return self
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
+@pytest.mark.parametrize(("auth_payload", "expected_auth_header"), _AUTH_HEADER_CASES)
+def test_build_headers_by_auth_mode(auth_payload, expected_auth_header):
+    expected = {"Authorization": expected_auth_header} if expected_auth_header else {}
+    assert management_api._build_headers({"auth": auth_payload}) == expected
 
-        def read(self):
-            return b'{"status":"ok"}'
 
+@pytest.mark.parametrize(("auth_payload", "expected_auth_header"), _AUTH_HEADER_CASES)
+def test_request_json_sets_authorization_header_by_auth_mode(
+    monkeypatch, auth_payload, expected_auth_header
+):
     captured = {"headers": []}
 
-    def fake_getaddrinfo(host, port, proto):
-        return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80))]
-
     class FakeHTTPConnection:
         def __init__(self, host, port, connect_host, timeout):
             _ = (host, port, connect_host, timeout)
@@ -1705,108 +1681,67 @@ def test_request_json_sets_authorization_header_by_auth_mode(monkeypatch):
             captured["headers"].append(headers.get("Authorization"))
 
         def getresponse(self):
-            return FakeResponse()
+            return _FakeHTTPResponse(b'{"status":"ok"}')
 
         def close(self):
             return None
 
-    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
     monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
 
-    cases = [
-        ({"type": "bearer", "token": "node-token"}, "Bearer node-token"),
-        ({"type": "bearer"}, None),
-        ({"type": "basic", "encoded": "abc", "username": "camera", "password": "secret"}, None),
-    ]
-
-    for auth_payload, expected_auth_header in cases:
-        captured["headers"].clear()
-        webcam = {"base_url": "http://example.com", "auth": auth_payload}
-        status_code, _ = management_api._request_json(webcam, "GET", "/api/status")
-        assert status_code == 200
-        assert captured["headers"] == [expected_auth_header]
-
+    webcam = {"base_url": "http://example.com", "auth": auth_payload}
+    status_code, _ = management_api._request_json(webcam, "GET", "/api/status")
+    assert status_code == 200
+    assert captured["headers"] == [expected_auth_header]
 
-def test_node_status_returns_node_unauthorized_when_upstream_rejects_token(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-    payload = {
-        "id": "node-auth-fail",
-        "name": "Auth Fail Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "bearer", "token": "wrong-token"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
 
-    def fake_request_json(node, method, path, body=None):
-        assert path == "/api/status"
-        return 401, {"status": "unauthorized"}
+def test_node_status_returns_node_unauthorized_when_upstream_rejects_token(
+    upstream, client, registered_node
+):
+    registered_node(
+        id="node-auth-fail",
+        name="Auth Fail Node",
+        base_url="http://example.com",
+        auth={"type": "bearer", "token": "wrong-token"},
+    )
 
-    monkeypatch.setattr(management_api, "_request_json", fake_request_json)
+    upstream.route("GET", "/api/status", status=401, body={"status": "unauthorized"})
 
-    status = client.get("/api/v1/webcams/node-auth-fail/status", headers=_auth_headers())
+    status = client.get("/api/v1/webcams/node-auth-fail/status", headers=_AUTH_HEADERS)
     assert status.status_code == 401
     assert status.json["error"]["code"] == "WEBCAM_UNAUTHORIZED"
 
-    overview = client.get("/api/v1/management/overview", headers=_auth_headers())
+    overview = client.get("/api/v1/management/overview", headers=_AUTH_HEADERS)
     assert overview.status_code == 200
     assert overview.json["webcams"][0]["error"]["code"] == "WEBCAM_UNAUTHORIZED"
 
 
-def test_node_status_succeeds_when_upstream_token_is_accepted(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-    payload = {
-        "id": "node-auth-ok",
-        "name": "Auth OK Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "bearer", "token": "shared-token"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def fake_request_json(node, method, path, body=None):
-        assert path == "/api/status"
-        return 200, {"status": "healthy", "stream_available": True}
+def test_node_status_succeeds_when_upstream_token_is_accepted(upstream, client, registered_node):
+    registered_node(
+        id="node-auth-ok",
+        name="Auth OK Node",
+        base_url="http://example.com",
+        auth={"type": "bearer", "token": "shared-token"},
+    )
 
-    monkeypatch.setattr(management_api, "_request_json", fake_request_json)
+    upstream.route(
+        "GET", "/api/status", status=200, body={"status": "healthy", "stream_available": True}
+    )
 
-    status = client.get("/api/v1/webcams/node-auth-ok/status", headers=_auth_headers())
+    status = client.get("/api/v1/webcams/node-auth-ok/status", headers=_AUTH_HEADERS)
     assert status.status_code == 200
     assert status.json["stream_available"] is True
     assert status.json["status"] == "healthy"
     assert status.json["status_probe"]["status_code"] == 200
 
 
-def test_node_status_returns_node_api_mismatch_when_status_endpoint_missing(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-    payload = {
-        "id": "node-api-mismatch",
-        "name": "API Mismatch Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def fake_request_json(node, method, path, body=None):
-        assert path == "/api/status"
-        return 404, {"error": "missing"}
+def test_node_status_returns_node_api_mismatch_when_status_endpoint_missing(
+    upstream, client, registered_node
+):
+    registered_node(id="node-api-mismatch", name="API Mismatch Node", base_url="http://example.com")
 
-    monkeypatch.setattr(management_api, "_request_json", fake_request_json)
+    upstream.route("GET", "/api/status", status=404, body={"error": "missing"})
 
-    status = client.get("/api/v1/webcams/node-api-mismatch/status", headers=_auth_headers())
+    status = client.get("/api/v1/webcams/node-api-mismatch/status", headers=_AUTH_HEADERS)
     assert status.status_code == 502
     assert status.json["error"]["code"] == "WEBCAM_API_MISMATCH"
     assert status.json["error"]["details"] == {
@@ -1815,54 +1750,34 @@ def test_node_status_returns_node_api_mismatch_when_status_endpoint_missing(monk
     }
 
 
-def test_node_status_maps_503_payload_without_error_envelope(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-    payload = {
-        "id": "node-unhealthy",
-        "name": "Unhealthy Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def fake_request_json(node, method, path, body=None):
-        assert path == "/api/status"
-        return 503, {"status": "unhealthy", "stream_available": False}
+def test_node_status_maps_503_payload_without_error_envelope(upstream, client, registered_node):
+    registered_node(id="node-unhealthy", name="Unhealthy Node", base_url="http://example.com")
 
-    monkeypatch.setattr(management_api, "_request_json", fake_request_json)
+    upstream.route(
+        "GET", "/api/status", status=503, body={"status": "unhealthy", "stream_available": False}
+    )
 
-    status = client.get("/api/v1/webcams/node-unhealthy/status", headers=_auth_headers())
+    status = client.get("/api/v1/webcams/node-unhealthy/status", headers=_AUTH_HEADERS)
     assert status.status_code == 200
     assert status.json["webcam_id"] == "node-unhealthy"
     assert status.json["status"] == "unhealthy"
     assert status.json["stream_available"] is False
 
-    overview = client.get("/api/v1/management/overview", headers=_auth_headers())
+    overview = client.get("/api/v1/management/overview", headers=_AUTH_HEADERS)
     assert overview.status_code == 200
     assert overview.json["summary"]["unavailable_webcams"] == 0
     assert overview.json["summary"]["healthy_webcams"] == 0
 
 
-def test_management_overview_counts_unsupported_transport_as_unavailable(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-non-http",
-        "name": "Docker Node",
-        "base_url": "docker://proxy:2375/container-id",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "docker",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
+def test_management_overview_counts_unsupported_transport_as_unavailable(
+    monkeypatch, client, registered_node
+):
+    registered_node(
+        id="node-non-http",
+        name="Docker Node",
+        base_url="docker://proxy:2375/container-id",
+        transport="docker",
+    )
 
     def fake_get_docker_container_status(proxy_host, proxy_port, container_id, auth_headers):
         raise management_api.NodeConnectivityError(
@@ -1878,7 +1793,7 @@ def test_management_overview_counts_unsupported_transport_as_unavailable(monkeyp
         fake_get_docker_container_status,
     )
 
-    overview = client.get("/api/v1/management/overview", headers=_auth_headers())
+    overview = client.get("/api/v1/management/overview", headers=_AUTH_HEADERS)
     assert overview.status_code == 200
     assert overview.json["summary"]["total_webcams"] == 1
     assert overview.json["summary"]["unavailable_webcams"] == 1
@@ -1886,127 +1801,164 @@ def test_management_overview_counts_unsupported_transport_as_unavailable(monkeyp
     assert overview.json["webcams"][0]["error"]["code"] == "DOCKER_PROXY_UNREACHABLE"
 
 
-def test_management_routes_require_authentication(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
+def test_statuses_for_webcams_polls_concurrently_and_preserves_order(monkeypatch):
+    nodes = [{"id": f"node-{index}"} for index in range(3)]
+    barrier = threading.Barrier(len(nodes), timeout=5)
 
-    payload = {
-        "id": "node-authz",
-        "name": "Authz Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
+    def fake_status_for_webcam(node):
+        # Every poll must be in flight at once for the barrier to release.
+        barrier.wait()
+        return {"webcam_id": node["id"]}, None
 
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
+    monkeypatch.setattr(management_api, "_status_for_webcam", fake_status_for_webcam)
 
-    endpoints = [
-        ("get", "/api/v1/webcams", None),
-        ("post", "/api/v1/webcams", payload),
-        ("get", "/api/v1/webcams/node-authz", None),
-        ("put", "/api/v1/webcams/node-authz", {"name": "renamed"}),
-        ("delete", "/api/v1/webcams/node-authz", None),
-        ("get", "/api/v1/webcams/node-authz/status", None),
-        ("post", "/api/v1/webcams/node-authz/actions/restart", {}),
-        ("get", "/api/v1/management/overview", None),
-    ]
+    results = management_api._statuses_for_webcams(nodes)
 
-    for method, path, json_payload in endpoints:
-        requester = getattr(client, method)
-        kwargs = {"json": json_payload} if json_payload is not None else {}
+    assert [result["webcam_id"] for result, _error in results] == ["node-0", "node-1", "node-2"]
 
-        missing_token_response = requester(path, **kwargs)
-        assert missing_token_response.status_code == 401
-        assert missing_token_response.json["error"]["code"] == "UNAUTHORIZED"
 
-        invalid_token_response = requester(
-            path,
-            headers={"Authorization": "Bearer invalid-token"},
-            **kwargs,
+def test_management_overview_aggregates_several_webcams_in_registry_order(
+    monkeypatch, upstream, client, registered_node
+):
+    registered_node(id="node-overview-a", name="Overview A", base_url="http://a.example.com")
+    registered_node(
+        id="node-overview-docker",
+        name="Overview Docker",
+        base_url="docker://proxy:2375/container-id",
+        transport="docker",
+    )
+    registered_node(id="node-overview-b", name="Overview B", base_url="http://b.example.com")
+
+    upstream.route(
+        "GET", "/api/status", status=200, body={"status": "healthy", "stream_available": True}
+    )
+
+    def fake_get_docker_container_status(proxy_host, proxy_port, container_id, auth_headers):
+        raise management_api.NodeConnectivityError(
+            "cannot connect",
+            reason="connection refused",
+            category="connection_refused_or_reset",
+            raw_error="connection refused",
         )
-        assert invalid_token_response.status_code == 401
-        assert invalid_token_response.json["error"]["code"] == "UNAUTHORIZED"
 
+    monkeypatch.setattr(
+        management_api, "_get_docker_container_status", fake_get_docker_container_status
+    )
 
-def test_node_status_maps_invalid_upstream_payload_to_controlled_error(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
+    overview = client.get("/api/v1/management/overview", headers=_AUTH_HEADERS)
 
-    payload = {
-        "id": "node-invalid-status",
-        "name": "Invalid Status Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
+    assert overview.status_code == 200
+    assert [webcam["webcam_id"] for webcam in overview.json["webcams"]] == [
+        "node-overview-a",
+        "node-overview-docker",
+        "node-overview-b",
+    ]
+    assert overview.json["webcams"][1]["error"]["code"] == "DOCKER_PROXY_UNREACHABLE"
+    assert overview.json["summary"]["total_webcams"] == 3
+    assert overview.json["summary"]["healthy_webcams"] == 2
+    assert overview.json["summary"]["unavailable_webcams"] == 1
+    assert sorted(call[0] for call in upstream.calls) == ["node-overview-a", "node-overview-b"]
+
+
+_AUTHZ_NODE_PAYLOAD = _node_payload(
+    id="node-authz", name="Authz Node", base_url="http://example.com"
+)
+
+
+@pytest.fixture
+def authz_node(registered_node):
+    """Register the webcam addressed by ``_AUTHZ_ENDPOINTS``."""
+    return registered_node(**_AUTHZ_NODE_PAYLOAD)
+
+
+_AUTHZ_ENDPOINTS = (
+    ("get", "/api/v1/webcams", None),
+    ("post", "/api/v1/webcams", _AUTHZ_NODE_PAYLOAD),
+    ("get", "/api/v1/webcams/node-authz", None),
+    ("put", "/api/v1/webcams/node-authz", {"name": "renamed"}),
+    ("delete", "/api/v1/webcams/node-authz", None),
+    ("get", "/api/v1/webcams/node-authz/status", None),
+    ("post", "/api/v1/webcams/node-authz/actions/restart", {}),
+    ("get", "/api/v1/management/overview", None),
+)
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "json_payload"),
+    _AUTHZ_ENDPOINTS,
+    ids=[f"{method}:{path}" for method, path, _ in _AUTHZ_ENDPOINTS],
+)
+@pytest.mark.parametrize(
+    "headers",
+    [None, _INVALID_AUTH_HEADERS],
+    ids=["missing-token", "invalid-token"],
+)
+@pytest.mark.usefixtures("authz_node")
+def test_management_routes_require_authentication(method, path, json_payload, headers, client):
+    response = client.open(path, method=method.upper(), json=json_payload, headers=headers)
+    assert response.status_code == 401
+    assert response.json["error"]["code"] == "UNAUTHORIZED"
 
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
 
-    def raise_invalid_response(node, method, path, body=None):
-        raise management_api.NodeInvalidResponseError("webcam returned malformed JSON")
+def test_node_status_maps_invalid_upstream_payload_to_controlled_error(
+    upstream, client, registered_node
+):
+    registered_node(
+        id="node-invalid-status", name="Invalid Status Node", base_url="http://example.com"
+    )
 
-    monkeypatch.setattr(management_api, "_request_json", raise_invalid_response)
+    upstream.route(
+        "GET",
+        "/api/status",
+        error=management_api.NodeInvalidResponseError("webcam returned malformed JSON"),
+    )
 
-    response = client.get("/api/v1/webcams/node-invalid-status/status", headers=_auth_headers())
+    response = client.get("/api/v1/webcams/node-invalid-status/status", headers=_AUTH_HEADERS)
     assert response.status_code == 502
     assert response.json["error"]["code"] == "WEBCAM_INVALID_RESPONSE"
     assert response.json["error"]["details"]["reason"] == "malformed json"
 
-    overview = client.get("/api/v1/management/overview", headers=_auth_headers())
+    overview = client.get("/api/v1/management/overview", headers=_AUTH_HEADERS)
     assert overview.status_code == 200
     assert overview.json["webcams"][0]["error"]["code"] == "WEBCAM_INVALID_RESPONSE"
 
 
-def test_node_action_forwards_restart_and_unsupported_action_payload(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-action-contract",
-        "name": "Action Contract Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def fake_request_json(node, method, path, body=None):
-        assert node["id"] == "node-action-contract"
-        assert method == "POST"
-        if path == "/api/actions/restart":
-            return 501, {
-                "error": {
-                    "code": "ACTION_NOT_IMPLEMENTED",
-                    "message": "action 'restart' is recognized but not implemented",
-                    "details": {"supported_actions": ["restart"]},
-                }
+def test_node_action_forwards_restart_and_unsupported_action_payload(
+    upstream, client, registered_node
+):
+    registered_node(
+        id="node-action-contract", name="Action Contract Node", base_url="http://example.com"
+    )
+
+    upstream.route(
+        "POST",
+        "/api/actions/restart",
+        status=501,
+        body={
+            "error": {
+                "code": "ACTION_NOT_IMPLEMENTED",
+                "message": "action 'restart' is recognized but not implemented",
+                "details": {"supported_actions": ["restart"]},
             }
-        if path == "/api/actions/refresh":
-            return 400, {
-                "error": {
-                    "code": "ACTION_UNSUPPORTED",
-                    "message": "action 'refresh' is not supported",
-                    "details": {"supported_actions": ["restart"]},
-                }
+        },
+    )
+    upstream.route(
+        "POST",
+        "/api/actions/refresh",
+        status=400,
+        body={
+            "error": {
+                "code": "ACTION_UNSUPPORTED",
+                "message": "action 'refresh' is not supported",
+                "details": {"supported_actions": ["restart"]},
             }
-        raise AssertionError(f"unexpected path: {path}")
-
-    monkeypatch.setattr(management_api, "_request_json", fake_request_json)
+        },
+    )
 
     restart = client.post(
         "/api/v1/webcams/node-action-contract/actions/restart",
         json={},
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert restart.status_code == 501
     assert restart.json["action"] == "restart"
@@ -2016,40 +1968,35 @@ def test_node_action_forwards_restart_and_unsupported_action_payload(monkeypatch
     unsupported = client.post(
         "/api/v1/webcams/node-action-contract/actions/refresh",
         json={},
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert unsupported.status_code == 400
     assert unsupported.json["action"] == "refresh"
     assert unsupported.json["status_code"] == 400
     assert unsupported.json["response"]["error"]["code"] == "ACTION_UNSUPPORTED"
+    assert upstream.calls == [
+        ("node-action-contract", "POST", "/api/actions/restart", {}),
+        ("node-action-contract", "POST", "/api/actions/refresh", {}),
+    ]
 
 
-def test_node_action_maps_invalid_upstream_payload_to_controlled_error(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-invalid-action",
-        "name": "Invalid Action Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def raise_invalid_response(node, method, path, body=None):
-        raise management_api.NodeInvalidResponseError("webcam returned malformed JSON")
+def test_node_action_maps_invalid_upstream_payload_to_controlled_error(
+    upstream, client, registered_node
+):
+    registered_node(
+        id="node-invalid-action", name="Invalid Action Node", base_url="http://example.com"
+    )
 
-    monkeypatch.setattr(management_api, "_request_json", raise_invalid_response)
+    upstream.route(
+        "POST",
+        "/api/actions/restart",
+        error=management_api.NodeInvalidResponseError("webcam returned malformed JSON"),
+    )
 
     response = client.post(
         "/api/v1/webcams/node-invalid-action/actions/restart",
         json={},
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert response.status_code == 502
     assert response.json["error"]["code"] == "WEBCAM_INVALID_RESPONSE"
@@ -2057,60 +2004,42 @@ def test_node_action_maps_invalid_upstream_payload_to_controlled_error(monkeypat
     assert response.json["error"]["details"]["action"] == "restart"
 
 
-def test_node_status_maps_non_object_upstream_payload_to_controlled_error(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-non-object-status",
-        "name": "Non Object Status Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def raise_invalid_response(node, method, path, body=None):
-        raise management_api.NodeInvalidResponseError("webcam returned non-object JSON")
+def test_node_status_maps_non_object_upstream_payload_to_controlled_error(
+    upstream, client, registered_node
+):
+    registered_node(
+        id="node-non-object-status", name="Non Object Status Node", base_url="http://example.com"
+    )
 
-    monkeypatch.setattr(management_api, "_request_json", raise_invalid_response)
+    upstream.route(
+        "GET",
+        "/api/status",
+        error=management_api.NodeInvalidResponseError("webcam returned non-object JSON"),
+    )
 
-    response = client.get("/api/v1/webcams/node-non-object-status/status", headers=_auth_headers())
+    response = client.get("/api/v1/webcams/node-non-object-status/status", headers=_AUTH_HEADERS)
     assert response.status_code == 502
     assert response.json["error"]["code"] == "WEBCAM_INVALID_RESPONSE"
     assert response.json["error"]["details"]["reason"] == "malformed json"
 
 
-def test_node_action_maps_non_object_upstream_payload_to_controlled_error(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-non-object-action",
-        "name": "Non Object Action Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def raise_invalid_response(node, method, path, body=None):
-        raise management_api.NodeInvalidResponseError("webcam returned non-object JSON")
+def test_node_action_maps_non_object_upstream_payload_to_controlled_error(
+    upstream, client, registered_node
+):
+    registered_node(
+        id="node-non-object-action", name="Non Object Action Node", base_url="http://example.com"
+    )
 
-    monkeypatch.setattr(management_api, "_request_json", raise_invalid_response)
+    upstream.route(
+        "POST",
+        "/api/actions/restart",
+        error=management_api.NodeInvalidResponseError("webcam returned non-object JSON"),
+    )
 
     response = client.post(
         "/api/v1/webcams/node-non-object-action/actions/restart",
         json={},
-        headers=_auth_headers(),
+        headers=_AUTH_HEADERS,
     )
     assert response.status_code == 502
     assert response.json["error"]["code"] == "WEBCAM_INVALID_RESPONSE"
@@ -2118,73 +2047,61 @@ def test_node_action_maps_non_object_upstream_payload_to_controlled_error(monkey
     assert response.json["error"]["details"]["action"] == "restart"
 
 
-def test_create_node_migrates_legacy_auth_with_token(monkeypatch, tmp_path):
-    client, _ = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-legacy-convert",
-        "name": "Legacy Convertible",
-        "base_url": "http://example.com",
-        "auth": {
+def test_create_node_migrates_legacy_auth_with_token(client, node_payload):
+    payload = node_payload(
+        id="node-legacy-convert",
+        name="Legacy Convertible",
+        base_url="http://example.com",
+        auth={
             "type": "basic",
             "token": "api-token",
             "username": "legacy",
             "password": "legacy",
         },
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
+    )
 
-    response = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
+    response = client.post("/api/v1/webcams", json=payload, headers=_AUTH_HEADERS)
     assert response.status_code == 201
     assert response.json["auth"] == {"type": "bearer", "token": "api-token"}
 
 
-def test_request_json_uses_vetted_resolved_ip_and_preserves_host_header(monkeypatch):
-    from pi_camera_in_docker import management_api
-
-    class FakeResponse:
-        status = 200
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def read(self):
-            return b'{"ok": true}'
-
+def test_request_json_uses_vetted_resolved_ip_and_preserves_host_header(
+    monkeypatch, pinned_response
+):
     captured = {}
 
     def fake_getaddrinfo(host, port, proto):
         captured["getaddrinfo"] = (host, port, proto)
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80)),
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80)),
-        ]
+        return _addrinfo("93.184.216.34", "93.184.216.34")
 
-    class FakeHTTPConnection:
-        def __init__(self, host, port, connect_host, timeout):
-            captured["connect_host"] = connect_host
-            captured["timeout"] = timeout
-            _ = (host, port)
+    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
+    requests = pinned_response()
 
-        def request(self, method, target, body=None, headers=None):
-            captured["target"] = target
-            captured["host"] = headers.get("Host")
-            _ = (method, body)
+    status_code, payload = management_api._request_json(
+        {"base_url": "http://example.com", "auth": {"type": "none"}},
+        "GET",
+        "/api/status",
+    )
 
-        def getresponse(self):
-            return FakeResponse()
+    assert status_code == 200
+    assert payload == {"ok": True}
+    assert captured["getaddrinfo"] == ("example.com", None, socket.IPPROTO_TCP)
+    [request] = requests
+    assert request["connect_host"] == "93.184.216.34"
+    assert request["target"] == "/api/status"
+    assert request["headers"].get("Host") == "example.com"
+    assert request["timeout"] == pytest.approx(management_api.REQUEST_TIMEOUT_SECONDS, abs=0.5)
 
-        def close(self):
-            return None
 
-    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
-    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+def test_request_json_retries_next_vetted_address_when_first_connection_fails(monkeypatch):
+    monkeypatch.setattr(
+        management_api.socket,
+        "getaddrinfo",
+        lambda host, port, proto: _addrinfo("93.184.216.34", "93.184.216.35"),
+    )
+    outcomes = []
+    connection_class = _flaky_connection_class([socket.timeout("timed out")], outcomes)
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", connection_class)
 
     status_code, payload = management_api._request_json(
         {"base_url": "http://example.com", "auth": {"type": "none"}},
@@ -2194,348 +2111,574 @@ def test_request_json_uses_vetted_resolved_ip_and_preserves_host_header(monkeypa
 
     assert status_code == 200
     assert payload == {"ok": True}
-    assert captured["getaddrinfo"] == ("example.com", None, socket.IPPROTO_TCP)
-    assert captured["connect_host"] == "93.184.216.34"
-    assert captured["target"] == "/api/status"
-    assert captured["host"] == "example.com"
-    assert captured["timeout"] == management_api.REQUEST_TIMEOUT_SECONDS
+    assert outcomes == ["fail", "ok"]
+    assert [request["connect_host"] for request in connection_class.requests] == [
+        "93.184.216.34",
+        "93.184.216.35",
+    ]
 
 
-def test_request_json_retries_next_vetted_address_when_first_connection_fails(monkeypatch):
-    from pi_camera_in_docker import management_api
+def test_request_json_raises_for_array_json_payload(pinned_response):
+    pinned_response(b"[1, 2, 3]")
+
+    with pytest.raises(management_api.NodeInvalidResponseError, match="non-object JSON"):
+        management_api._request_json(
+            {"base_url": "http://example.com", "auth": {"type": "none"}},
+            "GET",
+            "/api/status",
+        )
+
 
-    class FakeResponse:
-        status = 200
+def test_request_json_raises_for_scalar_json_payload(pinned_response):
+    pinned_response(b'"ok"')
 
-        def __enter__(self):
-            return self
+    with pytest.raises(management_api.NodeInvalidResponseError, match="non-object JSON"):
+        management_api._request_json(
+            {"base_url": "http://example.com", "auth": {"type": "none"}},
+            "GET",
+            "/api/status",
+        )
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
 
-        def read(self):
-            return b'{"ok": true}'
+def test_request_json_rejects_oversized_response_body(monkeypatch, pinned_response):
+    pinned_response(b" " * 64)
+    monkeypatch.setattr(management_api, "MAX_RESPONSE_BYTES", 16)
 
+    with pytest.raises(management_api.NodeInvalidResponseError, match="size limit"):
+        management_api._request_json(
+            {"base_url": "http://example.com", "auth": {"type": "none"}},
+            "GET",
+            "/api/status",
+        )
+
+
+def test_read_body_grows_buffer_for_unknown_length_and_stops_past_limit(monkeypatch):
+    class ChunkedResponse(_FakeHTTPResponse):
+        body = b'{"frames": "' + b"x" * 200 + b'"}'
+
+        def __init__(self):
+            super().__init__()
+            self.length = None
+
+    monkeypatch.setattr(management_api, "_READ_BUFFERS", threading.local())
+    monkeypatch.setattr(management_api, "_READ_CHUNK_BYTES", 8)
+
+    view = management_api._read_body(ChunkedResponse(), limit=1024)
+    assert bytes(view) == ChunkedResponse.body
+
+    view = management_api._read_body(ChunkedResponse(), limit=16)
+    assert len(view) == 17
+
+
+def test_decode_json_object_rejects_trailing_data():
+    assert management_api._decode_json_object(b' \n{"ok": true}\r\n') == {"ok": True}
+    with pytest.raises(management_api.NodeInvalidResponseError, match="malformed JSON"):
+        management_api._decode_json_object(b'{"ok": true} {"extra": 1}')
+
+
+def test_decode_json_object_rejects_non_finite_numbers():
+    # Python's json module accepts NaN/Infinity literals; orjson follows RFC 8259.
+    for payload in (b'{"fps": NaN}', b'{"fps": Infinity}', b'{"fps": -Infinity}'):
+        with pytest.raises(management_api.NodeInvalidResponseError, match="malformed JSON"):
+            management_api._decode_json_object(payload)
+
+
+def test_decode_json_object_distinguishes_non_object_from_malformed_json():
+    for payload in (b"[1, 2, 3]", b' \t"ok"', b"42"):
+        with pytest.raises(management_api.NodeInvalidResponseError, match="non-object JSON"):
+            management_api._decode_json_object(payload)
+
+    for payload in (b"   ", b"<html>bad gateway</html>", b"not json"):
+        with pytest.raises(management_api.NodeInvalidResponseError, match="malformed JSON"):
+            management_api._decode_json_object(payload)
+
+
+def test_request_json_maps_name_resolution_failure_to_dns_category(monkeypatch):
     def fake_getaddrinfo(host, port, proto):
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80)),
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.35", 80)),
-        ]
+        raise socket.gaierror("name or service not known")
 
-    attempted_addresses = []
+    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
 
-    class FakeHTTPConnection:
-        def __init__(self, host, port, connect_host, timeout):
-            _ = (host, port, timeout)
-            self.connect_host = connect_host
+    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
+    with pytest.raises(management_api.NodeConnectivityError) as excinfo:
+        management_api._request_json(webcam, "GET", "/api/status")
+    assert excinfo.value.reason == "dns resolution failed"
+    assert excinfo.value.category == "dns"
 
-        def request(self, method, target, body=None, headers=None):
-            _ = (method, target, body, headers)
 
-        def getresponse(self):
-            attempted_addresses.append(self.connect_host)
-            if self.connect_host == "93.184.216.34":
-                raise socket.timeout("timed out")
-            return FakeResponse()
+def test_resolve_caches_answers_until_ttl_expires(monkeypatch):
+    calls = []
+    now = {"value": 100.0}
 
-        def close(self):
-            return None
+    def fake_getaddrinfo(host, port, proto):
+        calls.append((host, port, proto))
+        return _addrinfo("93.184.216.34")
 
     monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
-    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+    monkeypatch.setattr(management_api.time, "monotonic", lambda: now["value"])
+    monkeypatch.setattr(management_api, "DNS_CACHE_TTL_SECONDS", 60.0)
 
-    status_code, payload = management_api._request_json(
-        {"base_url": "http://example.com", "auth": {"type": "none"}},
-        "GET",
-        "/api/status",
-    )
+    first = management_api._resolve("example.com", None)
+    second = management_api._resolve("example.com", None)
+    assert first == second
+    assert calls == [("example.com", None, socket.IPPROTO_TCP)]
+
+    now["value"] += 61.0
+    management_api._resolve("example.com", None)
+    assert len(calls) == 2
 
-    assert status_code == 200
-    assert payload == {"ok": True}
-    assert attempted_addresses == ["93.184.216.34", "93.184.216.35"]
 
+def test_resolve_negative_caches_resolution_failures_briefly(monkeypatch):
+    calls = []
+    now = {"value": 100.0}
 
-def test_request_json_raises_for_array_json_payload(monkeypatch):
-    from pi_camera_in_docker import management_api
+    def fake_getaddrinfo(host, port, proto):
+        calls.append(host)
+        raise socket.gaierror("name or service not known")
 
-    class FakeResponse:
-        status = 200
+    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(management_api.time, "monotonic", lambda: now["value"])
+    monkeypatch.setattr(management_api, "DNS_CACHE_TTL_SECONDS", 60.0)
 
-        def read(self):
-            return b"[1, 2, 3]"
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            management_api._resolve("missing.example", None)
+    assert calls == ["missing.example"]
 
-    class FakeHTTPConnection:
-        def __init__(self, host, port, connect_host, timeout):
-            _ = (host, port, connect_host, timeout)
+    now["value"] += management_api.DNS_NEGATIVE_CACHE_TTL_SECONDS + 1
+    with pytest.raises(socket.gaierror):
+        management_api._resolve("missing.example", None)
+    assert calls == ["missing.example", "missing.example"]
 
-        def request(self, method, target, body=None, headers=None):
-            _ = (method, target, body, headers)
 
-        def getresponse(self):
-            return FakeResponse()
+def test_resolve_cache_is_bounded_and_evicts_least_recently_used(monkeypatch):
+    calls = []
 
-        def close(self):
-            return None
+    def fake_getaddrinfo(host, port, proto):
+        calls.append(host)
+        return _addrinfo("93.184.216.34")
 
-    monkeypatch.setattr(
-        management_api.socket,
-        "getaddrinfo",
-        lambda host, port, proto: [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80))
-        ],
-    )
-    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(management_api, "DNS_CACHE_TTL_SECONDS", 60.0)
+    monkeypatch.setattr(management_api, "MAX_DNS_CACHE_ENTRIES", 2)
 
-    with pytest.raises(management_api.NodeInvalidResponseError, match="non-object JSON"):
-        management_api._request_json(
-            {"base_url": "http://example.com", "auth": {"type": "none"}},
-            "GET",
-            "/api/status",
-        )
+    management_api._resolve("a.example", None)
+    management_api._resolve("b.example", None)
+    management_api._resolve("a.example", None)
+    management_api._resolve("c.example", None)
+
+    assert list(management_api._DNS_CACHE) == [("a.example", None), ("c.example", None)]
+    management_api._resolve("b.example", None)
+    assert calls == ["a.example", "b.example", "c.example", "b.example"]
+
+
+def test_vet_resolved_addresses_raises_when_all_addresses_blocked():
+    addresses = ("127.0.0.1", "10.0.0.5")
+
+    with pytest.raises(management_api.NodeRequestError) as excinfo:
+        management_api._vet_resolved_addresses(addresses)
+    assert str(excinfo.value) == "webcam target is not allowed"
+
+
+def test_vet_resolved_addresses_returns_only_allowed_from_mixed_results():
+    addresses = ("127.0.0.1", "93.184.216.34", "10.0.0.5", "93.184.216.35")
+
+    assert management_api._vet_resolved_addresses(addresses) == ("93.184.216.34", "93.184.216.35")
+
+
+def test_vet_resolved_addresses_deduplicates_allowed_addresses():
+    addresses = ("93.184.216.34", "93.184.216.34", "93.184.216.35", "93.184.216.35")
 
+    assert management_api._vet_resolved_addresses(addresses) == ("93.184.216.34", "93.184.216.35")
 
-def test_request_json_raises_for_scalar_json_payload(monkeypatch):
-    from pi_camera_in_docker import management_api
 
-    class FakeResponse:
-        status = 200
+def test_request_json_uses_allowed_ip_when_resolved_set_contains_blocked_ip(monkeypatch):
+    def fake_getaddrinfo(host, port, proto):
+        return _addrinfo("127.0.0.1", "93.184.216.34")
 
-        def read(self):
-            return b'"ok"'
+    attempted_addresses = []
 
     class FakeHTTPConnection:
         def __init__(self, host, port, connect_host, timeout):
-            _ = (host, port, connect_host, timeout)
+            _ = (host, port, timeout)
+            self.connect_host = connect_host
 
         def request(self, method, target, body=None, headers=None):
             _ = (method, target, body, headers)
 
         def getresponse(self):
-            return FakeResponse()
+            attempted_addresses.append(self.connect_host)
+            return _FakeHTTPResponse(b'{"ok": true}')
 
         def close(self):
             return None
 
-    monkeypatch.setattr(
-        management_api.socket,
-        "getaddrinfo",
-        lambda host, port, proto: [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80))
-        ],
-    )
+    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
     monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
 
-    with pytest.raises(management_api.NodeInvalidResponseError, match="non-object JSON"):
-        management_api._request_json(
-            {"base_url": "http://example.com", "auth": {"type": "none"}},
-            "GET",
-            "/api/status",
-        )
+    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
+    status_code, payload = management_api._request_json(webcam, "GET", "/api/status")
 
+    assert status_code == 200
+    assert payload == {"ok": True}
+    assert attempted_addresses == ["93.184.216.34"]
 
-def test_request_json_maps_name_resolution_failure_to_dns_category(monkeypatch):
-    from pi_camera_in_docker import management_api
 
+def test_request_json_rejects_when_every_resolved_ip_is_blocked(monkeypatch):
     def fake_getaddrinfo(host, port, proto):
-        raise socket.gaierror("name or service not known")
+        return _addrinfo("127.0.0.1", "10.0.0.5")
+
+    def fail_connection(*_args, **_kwargs):
+        raise AssertionError("no connection should be opened")
 
+    monkeypatch.delenv("MIO_ALLOW_PRIVATE_IPS", raising=False)
     monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", fail_connection)
 
     webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
-    try:
+    with pytest.raises(management_api.NodeRequestError, match="webcam target is not allowed"):
         management_api._request_json(webcam, "GET", "/api/status")
-        raise AssertionError("expected NodeConnectivityError")
-    except management_api.NodeConnectivityError as exc:
-        assert exc.reason == "dns resolution failed"
-        assert exc.category == "dns"
 
 
-def test_vet_resolved_addresses_raises_when_all_addresses_blocked():
-    from pi_camera_in_docker import management_api
+def test_request_json_reuses_keepalive_connection_for_same_pinned_target(monkeypatch):
+    class FakeResponse(_FakeHTTPResponse):
+        will_close = False
+        body = b'{"ok": true}'
 
-    addresses = ("127.0.0.1", "10.0.0.5")
+    opened = []
+    closed = []
 
-    try:
-        management_api._vet_resolved_addresses(addresses)
-        raise AssertionError("expected NodeRequestError")
-    except management_api.NodeRequestError as exc:
-        assert str(exc) == "webcam target is not allowed"
+    class FakeHTTPConnection:
+        sock = None
 
+        def __init__(self, host, port, connect_host, timeout):
+            _ = (host, port, connect_host, timeout)
+            opened.append(self)
 
-def test_vet_resolved_addresses_returns_only_allowed_from_mixed_results():
-    from pi_camera_in_docker import management_api
+        def request(self, method, target, body=None, headers=None):
+            _ = (method, target, body, headers)
 
-    addresses = ("127.0.0.1", "93.184.216.34", "10.0.0.5", "93.184.216.35")
+        def getresponse(self):
+            return FakeResponse()
 
-    assert management_api._vet_resolved_addresses(addresses) == ("93.184.216.34", "93.184.216.35")
+        def close(self):
+            closed.append(self)
 
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+    monkeypatch.setattr(management_api, "_CONNECTION_POOL", {})
 
-def test_vet_resolved_addresses_deduplicates_allowed_addresses():
-    from pi_camera_in_docker import management_api
+    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
+    for _ in range(3):
+        assert management_api._request_json(webcam, "GET", "/api/status") == (200, {"ok": True})
 
-    addresses = ("93.184.216.34", "93.184.216.34", "93.184.216.35", "93.184.216.35")
+    assert len(opened) == 1
+    assert closed == []
 
-    assert management_api._vet_resolved_addresses(addresses) == ("93.184.216.34", "93.184.216.35")
+    management_api._clear_connection_pool()
+    assert closed == opened
 
 
-def test_request_json_uses_allowed_ip_when_resolved_set_contains_blocked_ip(monkeypatch):
-    from pi_camera_in_docker import management_api
+def test_request_json_replaces_stale_keepalive_connection(monkeypatch):
+    class FakeResponse(_FakeHTTPResponse):
+        will_close = True
+        body = b'{"ok": true}'
 
-    def fake_getaddrinfo(host, port, proto):
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("127.0.0.1", 80)),
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80)),
-        ]
+    class StaleConnection:
+        closed = False
+        sock = None
 
-    class FakeResponse:
-        status = 200
+        def request(self, method, target, body=None, headers=None):
+            raise BrokenPipeError("broken pipe")
 
-        def read(self):
-            return b'{"ok": true}'
+        def close(self):
+            self.closed = True
 
-    attempted_addresses = []
+    opened = []
 
     class FakeHTTPConnection:
         def __init__(self, host, port, connect_host, timeout):
-            _ = (host, port, timeout)
-            self.connect_host = connect_host
+            _ = (host, port, connect_host, timeout)
+            opened.append(self)
 
         def request(self, method, target, body=None, headers=None):
             _ = (method, target, body, headers)
 
         def getresponse(self):
-            attempted_addresses.append(self.connect_host)
             return FakeResponse()
 
         def close(self):
             return None
 
-    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
+    stale = StaleConnection()
     monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+    monkeypatch.setattr(management_api, "_CONNECTION_POOL", {})
+    management_api._release_conn((False, "example.com", None, "93.184.216.34"), stale)
 
     webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
-    status_code, payload = management_api._request_json(webcam, "GET", "/api/status")
+    assert management_api._request_json(webcam, "GET", "/api/status") == (200, {"ok": True})
+    assert stale.closed is True
+    assert len(opened) == 1
+    assert not management_api._CONNECTION_POOL.get((False, "example.com", None, "93.184.216.34"))
 
-    assert status_code == 200
-    assert payload == {"ok": True}
-    assert attempted_addresses == ["93.184.216.34"]
 
+def test_request_json_sends_post_on_fresh_connection_despite_pooled_socket(monkeypatch):
+    class PooledConnection:
+        sock = None
 
-def test_request_json_maps_timeout_failure(monkeypatch):
-    from pi_camera_in_docker import management_api
+        def request(self, method, target, body=None, headers=None):
+            raise AssertionError("non-idempotent requests must not reuse pooled sockets")
 
-    captured = {}
+        def close(self):
+            return None
 
-    def fake_getaddrinfo(host, port, proto):
-        return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80))]
+    pooled = PooledConnection()
+    pool_key = (False, "example.com", None, "93.184.216.34")
+    connection_class = _flaky_connection_class([], [])
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", connection_class)
+    monkeypatch.setattr(management_api, "_CONNECTION_POOL", {})
+    management_api._release_conn(pool_key, pooled)
 
-    class FakeHTTPConnection:
-        def __init__(self, host, port, connect_host, timeout):
-            captured["timeout"] = timeout
-            _ = (host, port, connect_host)
+    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
+    assert management_api._request_json(webcam, "POST", "/api/actions/restart", body={}) == (
+        200,
+        {"ok": True},
+    )
 
-        def request(self, method, target, body=None, headers=None):
-            _ = (method, target, body, headers)
+    assert [request["method"] for request in connection_class.requests] == ["POST"]
+    assert [conn for conn, _ in management_api._CONNECTION_POOL[pool_key]] == [pooled]
 
-        def getresponse(self):
-            raise socket.timeout("timed out")
+
+def test_connection_pool_sweeps_expired_keys_and_caps_total(monkeypatch):
+    class PooledConnection:
+        closed = False
 
         def close(self):
-            return None
+            self.closed = True
 
-    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
-    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+    clock = [1000.0]
+    monkeypatch.setattr(management_api.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(management_api, "_CONNECTION_POOL", {})
+    monkeypatch.setattr(management_api, "MAX_KEEPALIVE_CONNECTIONS_TOTAL", 2)
 
-    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
-    try:
-        management_api._request_json(webcam, "GET", "/api/status")
-        raise AssertionError("expected NodeConnectivityError")
-    except management_api.NodeConnectivityError as exc:
-        assert captured["timeout"] == management_api.REQUEST_TIMEOUT_SECONDS
-        assert exc.reason == "request timed out"
-        assert exc.category == "timeout"
+    stale = PooledConnection()
+    management_api._release_conn((False, "old.example", None, "93.184.216.34"), stale)
+    clock[0] += management_api.KEEPALIVE_IDLE_SECONDS + 1
 
+    first, second, overflow = PooledConnection(), PooledConnection(), PooledConnection()
+    management_api._release_conn((False, "a.example", None, "93.184.216.35"), first)
+    assert stale.closed is True
+    assert (False, "old.example", None, "93.184.216.34") not in management_api._CONNECTION_POOL
 
-def test_request_json_maps_connection_refused_or_reset(monkeypatch):
-    from pi_camera_in_docker import management_api
+    management_api._release_conn((False, "b.example", None, "93.184.216.36"), second)
+    management_api._release_conn((False, "c.example", None, "93.184.216.37"), overflow)
+    assert overflow.closed is True
+    assert first.closed is False
+    assert second.closed is False
+    assert len(management_api._CONNECTION_POOL) == 2
 
-    def fake_getaddrinfo(host, port, proto):
-        return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80))]
 
-    class FakeHTTPConnection:
-        def __init__(self, host, port, connect_host, timeout):
-            _ = (host, port, connect_host, timeout)
+@pytest.mark.parametrize(
+    ("reason", "expected"),
+    [
+        (socket.gaierror("name or service not known"), ("dns resolution failed", "dns")),
+        (TimeoutError("timed out"), ("request timed out", "timeout")),
+        (ssl.SSLError("bad handshake"), ("tls handshake failed", "tls")),
+        (
+            ConnectionResetError("reset by peer"),
+            ("connection refused or reset", "connection_refused_or_reset"),
+        ),
+        ("[Errno 32] Broken pipe", ("connection refused or reset", "connection_refused_or_reset")),
+        ("certificate verify failed", ("tls handshake failed", "tls")),
+        (OSError("no route to host"), ("connection failed", "network")),
+    ],
+)
+def test_classify_url_error_maps_reasons_to_categories(reason, expected):
+    assert management_api._classify_url_error(reason) == expected
+
+
+def _flaky_connection_class(failures, outcomes, body=b'{"ok": true}'):
+    """Build a pinned-connection fake whose getresponse raises ``failures`` in turn.
+
+    Every request is recorded on the returned class's ``requests`` list.
+    """
+    requests = []
+
+    class FlakyHTTPConnection:
+        def __init__(self, host, port, connect_host, timeout, context=None):
+            _ = (host, port, context)
+            self.connect_host = connect_host
+            self.timeout = timeout
 
         def request(self, method, target, body=None, headers=None):
-            _ = (method, target, body, headers)
+            _ = body
+            requests.append(
+                {
+                    "connect_host": self.connect_host,
+                    "timeout": self.timeout,
+                    "method": method,
+                    "target": target,
+                    "headers": headers,
+                }
+            )
 
         def getresponse(self):
-            raise ConnectionRefusedError("connection refused")
+            if failures:
+                outcomes.append("fail")
+                raise failures.pop(0)
+            outcomes.append("ok")
+            return _FakeHTTPResponse(body)
 
         def close(self):
             return None
 
-    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
-    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+    FlakyHTTPConnection.requests = requests
+    return FlakyHTTPConnection
 
-    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
-    try:
+
+@pytest.fixture
+def failing_connection(monkeypatch, request):
+    """Make every pinned HTTP(S) connection fail once with ``request.param``, without retries."""
+    outcomes = []
+    connection_class = _flaky_connection_class([request.param], outcomes)
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", connection_class)
+    monkeypatch.setattr(management_api, "_PinnedHTTPSConnection", connection_class)
+    monkeypatch.setattr(management_api, "REQUEST_RETRY_ATTEMPTS", 0)
+    return outcomes
+
+
+@pytest.fixture
+def pinned_response(monkeypatch):
+    """Return a setter that makes every pinned HTTP(S) connection answer with ``body``.
+
+    The setter returns the list of recorded requests.
+    """
+
+    def _serve(body=b'{"ok": true}'):
+        connection_class = _flaky_connection_class([], [], body)
+        monkeypatch.setattr(management_api, "_PinnedHTTPConnection", connection_class)
+        monkeypatch.setattr(management_api, "_PinnedHTTPSConnection", connection_class)
+        return connection_class.requests
+
+    return _serve
+
+
+@pytest.mark.parametrize(
+    ("base_url", "failing_connection", "expected_reason", "expected_category"),
+    [
+        ("http://example.com", socket.timeout("timed out"), "request timed out", "timeout"),
+        (
+            "http://example.com",
+            ConnectionRefusedError("connection refused"),
+            "connection refused or reset",
+            "connection_refused_or_reset",
+        ),
+        (
+            "https://example.com",
+            ssl.SSLError("certificate verify failed"),
+            "tls handshake failed",
+            "tls",
+        ),
+    ],
+    ids=["timeout", "connection-refused", "tls"],
+    indirect=["failing_connection"],
+)
+def test_request_json_maps_connection_failures(
+    failing_connection, base_url, expected_reason, expected_category
+):
+    webcam = {"base_url": base_url, "auth": {"type": "none"}}
+    with pytest.raises(management_api.NodeConnectivityError) as excinfo:
         management_api._request_json(webcam, "GET", "/api/status")
-        raise AssertionError("expected NodeConnectivityError")
-    except management_api.NodeConnectivityError as exc:
-        assert exc.reason == "connection refused or reset"
-        assert exc.category == "connection_refused_or_reset"
+    assert failing_connection == ["fail"]
+    assert excinfo.value.reason == expected_reason
+    assert excinfo.value.category == expected_category
 
 
-def test_request_json_maps_tls_failure(monkeypatch):
-    from pi_camera_in_docker import management_api
+def test_request_json_retries_transient_failures_with_backoff(monkeypatch):
+    outcomes = []
+    sleeps = []
+    failures = [ConnectionRefusedError("connection refused"), socket.timeout("timed out")]
+    monkeypatch.setattr(
+        management_api, "_PinnedHTTPConnection", _flaky_connection_class(failures, outcomes)
+    )
+    monkeypatch.setattr(management_api.random, "uniform", lambda _low, _high: 0.0)
+    monkeypatch.setattr(management_api.time, "sleep", sleeps.append)
 
-    def fake_getaddrinfo(host, port, proto):
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 443))
-        ]
+    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
+    status_code, payload = management_api._request_json(webcam, "GET", "/api/status")
 
-    class FakeHTTPSConnection:
-        def __init__(self, host, port, connect_host, timeout, context):
-            _ = (host, port, connect_host, timeout, context)
+    assert (status_code, payload) == (200, {"ok": True})
+    assert outcomes == ["fail", "fail", "ok"]
+    assert sleeps == [0.1, 0.2]
+
+
+def test_request_json_retries_stay_within_deadline_under_repeated_timeouts(monkeypatch):
+    clock = [1000.0]
+    timeouts = []
+
+    class TimingOutConnection:
+        def __init__(self, host, port, connect_host, timeout, context=None):
+            _ = (host, port, connect_host, context)
+            self.timeout = timeout
 
         def request(self, method, target, body=None, headers=None):
             _ = (method, target, body, headers)
 
         def getresponse(self):
-            raise ssl.SSLError("certificate verify failed")
+            # Each attempt stalls for 2s, or until its own timeout if that is shorter.
+            timeouts.append(self.timeout)
+            clock[0] += min(self.timeout, 2.0)
+            raise socket.timeout("timed out")
 
         def close(self):
             return None
 
-    monkeypatch.setattr(management_api.socket, "getaddrinfo", fake_getaddrinfo)
-    monkeypatch.setattr(management_api, "_PinnedHTTPSConnection", FakeHTTPSConnection)
+    def fake_sleep(delay):
+        clock[0] += delay
+
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", TimingOutConnection)
+    monkeypatch.setattr(management_api.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(management_api.time, "sleep", fake_sleep)
+    monkeypatch.setattr(management_api.random, "uniform", lambda _low, _high: 0.0)
 
-    webcam = {"base_url": "https://example.com", "auth": {"type": "none"}}
-    try:
+    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
+    with pytest.raises(management_api.NodeConnectivityError) as excinfo:
         management_api._request_json(webcam, "GET", "/api/status")
-        raise AssertionError("expected NodeConnectivityError")
-    except management_api.NodeConnectivityError as exc:
-        assert exc.reason == "tls handshake failed"
-        assert exc.category == "tls"
 
+    assert excinfo.value.category == "timeout"
+    assert management_api.REQUEST_RETRY_DEADLINE_SECONDS == management_api.REQUEST_TIMEOUT_SECONDS
+    assert clock[0] - 1000.0 == pytest.approx(management_api.REQUEST_TIMEOUT_SECONDS)
+    # Retries split one request timeout: 5s, then 5 - 2 - 0.1 backoff, then 5 - 4.1 - 0.2.
+    assert timeouts == [5.0, pytest.approx(2.9), pytest.approx(0.7)]
 
-def test_request_json_https_uses_hostname_for_tls_and_pins_vetted_ip(monkeypatch):
-    from pi_camera_in_docker import management_api
 
-    class FakeResponse:
-        status = 200
+@pytest.mark.parametrize(
+    ("method", "failure"),
+    [
+        ("POST", ConnectionResetError("connection reset")),
+        ("GET", ssl.SSLError("wrong version number")),
+    ],
+    ids=["non-idempotent-method", "tls-category"],
+)
+def test_request_json_does_not_retry_unsafe_requests(monkeypatch, method, failure):
+    outcomes = []
+    monkeypatch.setattr(
+        management_api, "_PinnedHTTPConnection", _flaky_connection_class([failure], outcomes)
+    )
+    monkeypatch.setattr(management_api.time, "sleep", lambda _delay: None)
+
+    webcam = {"base_url": "http://example.com", "auth": {"type": "none"}}
+    with pytest.raises(management_api.NodeConnectivityError):
+        management_api._request_json(webcam, method, "/api/actions/restart")
+
+    assert outcomes == ["fail"]
 
-        def read(self):
-            return b'{"ok": true}'
 
+def test_request_json_https_uses_hostname_for_tls_and_pins_vetted_ip(monkeypatch):
     captured = {}
 
     def fake_getaddrinfo(host, port, proto):
         captured["getaddrinfo"] = (host, port, proto)
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 443))
-        ]
+        return _addrinfo("93.184.216.34", port=443)
 
     class FakeHTTPSConnection:
         def __init__(self, host, port, connect_host, timeout, context):
@@ -2543,6 +2686,7 @@ def test_request_json_https_uses_hostname_for_tls_and_pins_vetted_ip(monkeypatch
             captured["connect_host"] = connect_host
             captured["timeout"] = timeout
             captured["has_context"] = context is not None
+            captured["context"] = context
             _ = port
 
         def request(self, method, target, body=None, headers=None):
@@ -2552,7 +2696,7 @@ def test_request_json_https_uses_hostname_for_tls_and_pins_vetted_ip(monkeypatch
             _ = body
 
         def getresponse(self):
-            return FakeResponse()
+            return _FakeHTTPResponse(b'{"ok": true}')
 
         def close(self):
             return None
@@ -2574,24 +2718,54 @@ def test_request_json_https_uses_hostname_for_tls_and_pins_vetted_ip(monkeypatch
     assert captured["method"] == "GET"
     assert captured["target"] == "/api/status"
     assert captured["host_header"] == "example.com"
-    assert captured["timeout"] == management_api.REQUEST_TIMEOUT_SECONDS
+    assert captured["timeout"] == pytest.approx(management_api.REQUEST_TIMEOUT_SECONDS, abs=0.5)
     assert captured["has_context"] is True
+    assert captured["context"] is management_api._DEFAULT_SSL_CONTEXT
 
 
-def test_request_json_host_header_omits_userinfo_and_default_http_port(monkeypatch):
-    from pi_camera_in_docker import management_api
+def test_build_ssl_context_verifies_certificates_and_hostnames():
+    context = management_api._build_ssl_context()
+
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname is True
+
 
-    class FakeResponse:
-        status = 200
+def test_request_headers_memoize_host_headers_without_caching_tokens():
+    management_api._base_request_headers.cache_clear()
 
-        def read(self):
-            return b'{"ok": true}'
+    bearer = management_api._request_headers("example.com:8000", "node-token")
+    assert dict(bearer) == {
+        "Content-Type": "application/json",
+        "Host": "example.com:8000",
+        "Authorization": "Bearer node-token",
+    }
+    anonymous = management_api._request_headers("example.com:8000", None)
+    assert "Authorization" not in anonymous
+    assert management_api._request_headers("example.com:8000", "") is anonymous
+    assert management_api._base_request_headers.cache_info().currsize == 1
+
+
+def test_parse_base_url_memoizes_decomposed_target():
+    management_api._parse_base_url.cache_clear()
+
+    first = management_api._parse_base_url("https://user:pw@example.com:8443/cam")
+    second = management_api._parse_base_url("https://user:pw@example.com:8443/cam")
 
+    assert first is second
+    assert management_api._parse_base_url.cache_info().hits == 1
+    assert first.is_https is True
+    assert first.hostname == "example.com"
+    assert first.port == 8443
+    assert first.host_header == "example.com:8443"
+    assert first.path_prefix == "/cam"
+
+
+def test_request_json_host_header_omits_userinfo_and_default_http_port(monkeypatch):
     captured = {}
 
     def fake_getaddrinfo(host, port, proto):
         captured["getaddrinfo"] = (host, port, proto)
-        return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80))]
+        return _addrinfo("93.184.216.34")
 
     class FakeHTTPConnection:
         def __init__(self, host, port, connect_host, timeout):
@@ -2602,7 +2776,7 @@ def test_request_json_host_header_omits_userinfo_and_default_http_port(monkeypat
             _ = (method, target, body)
 
         def getresponse(self):
-            return FakeResponse()
+            return _FakeHTTPResponse(b'{"ok": true}')
 
         def close(self):
             return None
@@ -2623,16 +2797,8 @@ def test_request_json_host_header_omits_userinfo_and_default_http_port(monkeypat
 
 
 def test_request_json_host_header_formats_ipv6_and_omits_userinfo(monkeypatch):
-    from pi_camera_in_docker import management_api
-
     ipv6_host = "2606:2800:220:1:248:1893:25c8:1946"
 
-    class FakeResponse:
-        status = 200
-
-        def read(self):
-            return b'{"ok": true}'
-
     captured = {}
 
     class FakeHTTPConnection:
@@ -2644,7 +2810,7 @@ def test_request_json_host_header_formats_ipv6_and_omits_userinfo(monkeypatch):
             _ = (method, target, body)
 
         def getresponse(self):
-            return FakeResponse()
+            return _FakeHTTPResponse(b'{"ok": true}')
 
         def close(self):
             return None
@@ -2676,14 +2842,6 @@ def test_request_json_host_header_formats_ipv6_and_omits_userinfo(monkeypatch):
 
 
 def test_request_json_host_header_omits_default_https_port_without_explicit_port(monkeypatch):
-    from pi_camera_in_docker import management_api
-
-    class FakeResponse:
-        status = 200
-
-        def read(self):
-            return b'{"ok": true}'
-
     captured = {}
 
     class FakeHTTPSConnection:
@@ -2695,7 +2853,7 @@ def test_request_json_host_header_omits_default_https_port_without_explicit_port
             _ = (method, target, body)
 
         def getresponse(self):
-            return FakeResponse()
+            return _FakeHTTPResponse(b'{"ok": true}')
 
         def close(self):
             return None
@@ -2703,9 +2861,7 @@ def test_request_json_host_header_omits_default_https_port_without_explicit_port
     monkeypatch.setattr(
         management_api.socket,
         "getaddrinfo",
-        lambda host, port, proto: [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 443))
-        ],
+        lambda host, port, proto: _addrinfo("93.184.216.34", port=443),
     )
     monkeypatch.setattr(management_api, "_PinnedHTTPSConnection", FakeHTTPSConnection)
 
@@ -2720,42 +2876,31 @@ def test_request_json_host_header_omits_default_https_port_without_explicit_port
     assert captured["host_header"] == "example.com"
 
 
-def test_node_status_reports_connectivity_details(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-timeout",
-        "name": "Timeout Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
+def test_node_status_reports_connectivity_details(upstream, client, registered_node):
+    registered_node(id="node-timeout", name="Timeout Node", base_url="http://example.com")
 
-    def raise_timeout(node, method, path, body=None):
-        raise management_api.NodeConnectivityError(
+    upstream.route(
+        "GET",
+        "/api/status",
+        error=management_api.NodeConnectivityError(
             "request timed out",
             reason="request timed out",
             category="timeout",
             raw_error="timed out while connecting to example.com:80\nwith extra spacing",
-        )
-
-    monkeypatch.setattr(management_api, "_request_json", raise_timeout)
+        ),
+    )
 
-    status = client.get("/api/v1/webcams/node-timeout/status", headers=_auth_headers())
+    status = client.get("/api/v1/webcams/node-timeout/status", headers=_AUTH_HEADERS)
     assert status.status_code == 503
-    assert status.json["error"]["code"] == "NETWORK_UNREACHABLE"
-    assert status.json["error"]["details"]["reason"] == "request timed out"
-    assert status.json["error"]["details"]["category"] == "timeout"
-    assert "\n" not in status.json["error"]["details"]["raw_error"]
+    error = status.json["error"]
+    assert error["code"] == "NETWORK_UNREACHABLE"
+    assert error["details"]["reason"] == "request timed out"
+    assert error["details"]["category"] == "timeout"
+    assert "\n" not in error["details"]["raw_error"]
 
 
-def test_webcam_api_status_contract_shape_reports_required_fields(monkeypatch):
-    client = _new_webcam_contract_client()
+def test_webcam_api_status_contract_shape_reports_required_fields(webcam_contract):
+    client, _ = webcam_contract
 
     response = client.get("/api/status")
 
@@ -2786,149 +2931,70 @@ def test_webcam_api_status_contract_shape_with_auth(monkeypatch):
     assert authorized.json["app_mode"] == "webcam"
 
 
-def test_node_action_passthrough_for_api_test_management_actions(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-api-test-actions",
-        "name": "API Test Actions Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
+@pytest.fixture
+def api_test_actions_node(registered_node):
+    """Register the webcam targeted by the api-test action passthrough cases."""
+    return registered_node(
+        id="node-api-test-actions", name="API Test Actions Node", base_url="http://example.com"
+    )
 
-    captured_calls = []
-
-    def fake_request_json(node, method, path, body=None):
-        captured_calls.append((node["id"], method, path, body))
-        if path == "/api/actions/api-test-start":
-            return 200, {
-                "ok": True,
-                "action": "api-test-start",
-                "api_test": {
-                    "enabled": True,
-                    "active": True,
-                    "state_index": 0,
-                    "state_name": "ok",
-                    "next_transition_seconds": 1.0,
-                },
-            }
-        if path == "/api/actions/api-test-step":
-            return 200, {
-                "ok": True,
-                "action": "api-test-step",
-                "api_test": {
-                    "enabled": True,
-                    "active": False,
-                    "state_index": 1,
-                    "state_name": "degraded",
-                    "next_transition_seconds": None,
-                },
-            }
-        if path == "/api/actions/api-test-stop":
-            return 200, {
-                "ok": True,
-                "action": "api-test-stop",
-                "api_test": {
-                    "enabled": True,
-                    "active": False,
-                    "state_index": 1,
-                    "state_name": "degraded",
-                    "next_transition_seconds": None,
-                },
-            }
-        if path == "/api/actions/api-test-reset":
-            return 200, {
-                "ok": True,
-                "action": "api-test-reset",
-                "api_test": {
-                    "enabled": True,
-                    "active": False,
-                    "state_index": 0,
-                    "state_name": "ok",
-                    "next_transition_seconds": None,
-                },
-            }
-        raise AssertionError(f"unexpected path: {path}")
 
-    monkeypatch.setattr(management_api, "_request_json", fake_request_json)
-    try:
-        import main as main_module
+def _api_test_state(active, state_index, state_name, next_transition_seconds=None):
+    return {
+        "enabled": True,
+        "active": active,
+        "state_index": state_index,
+        "state_name": state_name,
+        "next_transition_seconds": next_transition_seconds,
+    }
 
-        monkeypatch.setitem(
-            main_module.register_management_routes.__globals__,
-            "_request_json",
-            fake_request_json,
-        )
-    except Exception:
-        pass
 
-    action_requests = [
-        (
+@pytest.mark.parametrize(
+    ("action_name", "request_body", "api_test"),
+    [
+        pytest.param(
             "api-test-start",
             {"interval_seconds": 1, "scenario_order": [0, 1, 2]},
-            {"enabled": True, "active": True, "state_index": 0},
-        ),
-        (
-            "api-test-step",
-            {},
-            {"enabled": True, "active": False, "state_index": 1},
-        ),
-        (
-            "api-test-stop",
-            {},
-            {"enabled": True, "active": False, "state_index": 1},
-        ),
-        (
-            "api-test-reset",
-            {},
-            {"enabled": True, "active": False, "state_index": 0},
+            _api_test_state(True, 0, "ok", 1.0),
+            id="start",
         ),
-    ]
-
-    for action_name, body, expected_api_test in action_requests:
-        response = client.post(
-            f"/api/v1/webcams/node-api-test-actions/actions/{action_name}",
-            json=body,
-            headers=_auth_headers(),
-        )
-        assert response.status_code == 200
-        assert response.json["webcam_id"] == "node-api-test-actions"
-        assert response.json["action"] == action_name
-        assert response.json["status_code"] == 200
-        assert response.json["response"]["ok"] is True
-        assert response.json["response"]["api_test"]["enabled"] == expected_api_test["enabled"]
-        assert response.json["response"]["api_test"]["active"] == expected_api_test["active"]
-        assert (
-            response.json["response"]["api_test"]["state_index"] == expected_api_test["state_index"]
-        )
+        pytest.param("api-test-step", {}, _api_test_state(False, 1, "degraded"), id="step"),
+        pytest.param("api-test-stop", {}, _api_test_state(False, 1, "degraded"), id="stop"),
+        pytest.param("api-test-reset", {}, _api_test_state(False, 0, "ok"), id="reset"),
+    ],
+)
+@pytest.mark.usefixtures("api_test_actions_node")
+def test_node_action_passthrough_for_api_test_management_actions(
+    upstream, client, action_name, request_body, api_test
+):
+    upstream.route(
+        "POST",
+        f"/api/actions/{action_name}",
+        body={"ok": True, "action": action_name, "api_test": api_test},
+    )
 
-    assert captured_calls == [
-        (
-            "node-api-test-actions",
-            "POST",
-            "/api/actions/api-test-start",
-            {"interval_seconds": 1, "scenario_order": [0, 1, 2]},
-        ),
-        ("node-api-test-actions", "POST", "/api/actions/api-test-step", {}),
-        ("node-api-test-actions", "POST", "/api/actions/api-test-stop", {}),
-        ("node-api-test-actions", "POST", "/api/actions/api-test-reset", {}),
+    response = client.post(
+        f"/api/v1/webcams/node-api-test-actions/actions/{action_name}",
+        json=request_body,
+        headers=_AUTH_HEADERS,
+    )
+    assert response.status_code == 200
+    assert response.json["webcam_id"] == "node-api-test-actions"
+    assert response.json["action"] == action_name
+    assert response.json["status_code"] == 200
+    assert response.json["response"]["ok"] is True
+    assert response.json["response"]["api_test"] == api_test
+
+    assert upstream.calls == [
+        ("node-api-test-actions", "POST", f"/api/actions/{action_name}", request_body)
     ]
 
 
 def test_diagnose_includes_structured_status_and_codes(monkeypatch):
-    management_api = importlib.import_module("pi_camera_in_docker.management_api")
-
     webcam = {"id": "node-diag", "base_url": "http://example.invalid:8000", "transport": "http"}
 
     def _fake_getaddrinfo(*_args, **_kwargs):
-        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("8.8.8.8", 8000))]
+        return _addrinfo("8.8.8.8", port=8000)
 
     def _fake_request_json(*_args, **_kwargs):
         return 503, {"status": "degraded"}
@@ -2957,9 +3023,46 @@ def test_diagnose_includes_structured_status_and_codes(monkeypatch):
     assert recommendation["message"] == payload["guidance"][0]
 
 
-def test_diagnose_mixed_dns_results_reports_allowed_and_blocked_ips(monkeypatch):
-    management_api = importlib.import_module("pi_camera_in_docker.management_api")
+def test_diagnose_resolves_dns_once_and_reuses_answer_for_status_request(monkeypatch):
+    webcam = {"id": "node-diag", "base_url": "http://example.invalid:8000", "transport": "http"}
+    lookups = []
+    connected = []
+
+    def _fake_getaddrinfo(host, port, proto):
+        lookups.append((host, port))
+        return _addrinfo("8.8.8.8", port=8000)
+
+    class FakeHTTPConnection:
+        def __init__(self, host, port, connect_host, timeout):
+            _ = (host, port, timeout)
+            connected.append(connect_host)
+
+        def request(self, method, target, body=None, headers=None):
+            _ = (method, target, body, headers)
+
+        def getresponse(self):
+            return _FakeHTTPResponse(b'{"status": "ok"}')
 
+        def close(self):
+            return None
+
+    # A stale cached answer must not leak into diagnostics.
+    management_api._DNS_CACHE[("example.invalid", 8000)] = (
+        float("inf"),
+        _addrinfo("1.1.1.1", port=8000),
+    )
+    monkeypatch.setattr(management_api.socket, "getaddrinfo", _fake_getaddrinfo)
+    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+
+    payload = management_api._diagnose_webcam(webcam)
+
+    assert payload["diagnostics"]["dns_resolution"]["resolved_ips"] == ["8.8.8.8"]
+    assert payload["diagnostics"]["api_endpoint"]["status"] == "pass"
+    assert lookups == [("example.invalid", 8000)]
+    assert connected == ["8.8.8.8"]
+
+
+def test_diagnose_mixed_dns_results_reports_allowed_and_blocked_ips(monkeypatch):
     webcam = {
         "id": "node-mixed-dns",
         "base_url": "http://example.invalid:8000",
@@ -2967,10 +3070,7 @@ def test_diagnose_mixed_dns_results_reports_allowed_and_blocked_ips(monkeypatch)
     }
 
     def _fake_getaddrinfo(*_args, **_kwargs):
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.1.10", 8000)),
-            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("8.8.8.8", 8000)),
-        ]
+        return _addrinfo("192.168.1.10", "8.8.8.8", port=8000)
 
     def _fake_request_json(*_args, **_kwargs):
         return 200, {"status": "ok"}
@@ -2990,8 +3090,6 @@ def test_diagnose_mixed_dns_results_reports_allowed_and_blocked_ips(monkeypatch)
 
 
 def test_diagnose_all_dns_results_blocked_includes_ssrf_ip_breakdown(monkeypatch):
-    management_api = importlib.import_module("pi_camera_in_docker.management_api")
-
     webcam = {
         "id": "node-blocked-dns",
         "base_url": "http://example.invalid:8000",
@@ -2999,10 +3097,7 @@ def test_diagnose_all_dns_results_blocked_includes_ssrf_ip_breakdown(monkeypatch
     }
 
     def _fake_getaddrinfo(*_args, **_kwargs):
-        return [
-            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 8000)),
-            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.1.10", 8000)),
-        ]
+        return _addrinfo("10.0.0.1", "192.168.1.10", port=8000)
 
     monkeypatch.setattr(management_api.socket, "getaddrinfo", _fake_getaddrinfo)
 
@@ -3021,9 +3116,6 @@ def test_diagnose_all_dns_results_blocked_includes_ssrf_ip_breakdown(monkeypatch
 def test_diagnose_recommendations_reference_canonical_private_ip_variable(monkeypatch):
     monkeypatch.delenv("MIO_ALLOW_PRIVATE_IPS", raising=False)
 
-    management_api = importlib.import_module("pi_camera_in_docker.management_api")
-    management_api = importlib.reload(management_api)
-
     webcam = {"id": "node-diag", "base_url": "http://example.invalid:8000", "transport": "http"}
 
     def _raise_timeout(*_args, **_kwargs):
@@ -3056,36 +3148,8 @@ def test_diagnose_recommendations_reference_canonical_private_ip_variable(monkey
     assert all("MOTION_IN_OCEAN_ALLOW_PRIVATE_IPS" not in message for message in ssrf_messages)
 
 
-def test_request_json_raises_for_non_utf8_payload(monkeypatch):
-    from pi_camera_in_docker import management_api
-
-    class FakeResponse:
-        status = 200
-
-        def read(self):
-            return b"\xff\xfe\xfa"
-
-    class FakeHTTPConnection:
-        def __init__(self, host, port, connect_host, timeout):
-            _ = (host, port, connect_host, timeout)
-
-        def request(self, method, target, body=None, headers=None):
-            _ = (method, target, body, headers)
-
-        def getresponse(self):
-            return FakeResponse()
-
-        def close(self):
-            return None
-
-    monkeypatch.setattr(
-        management_api.socket,
-        "getaddrinfo",
-        lambda host, port, proto: [
-            (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 80))
-        ],
-    )
-    monkeypatch.setattr(management_api, "_PinnedHTTPConnection", FakeHTTPConnection)
+def test_request_json_raises_for_non_utf8_payload(pinned_response):
+    pinned_response(b"\xff\xfe\xfa")
 
     with pytest.raises(management_api.NodeInvalidResponseError, match="non-UTF8 payload"):
         management_api._request_json(
@@ -3095,50 +3159,34 @@ def test_request_json_raises_for_non_utf8_payload(monkeypatch):
         )
 
 
-def test_node_status_maps_non_utf8_upstream_payload_to_controlled_error(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "node-non-utf8-status",
-        "name": "Non UTF8 Status Node",
-        "base_url": "http://example.com",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "http",
-    }
-
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
-
-    def raise_invalid_response(node, method, path, body=None):
-        raise management_api.NodeInvalidResponseError("webcam returned non-UTF8 payload")
+def test_node_status_maps_non_utf8_upstream_payload_to_controlled_error(
+    upstream, client, registered_node
+):
+    registered_node(
+        id="node-non-utf8-status", name="Non UTF8 Status Node", base_url="http://example.com"
+    )
 
-    monkeypatch.setattr(management_api, "_request_json", raise_invalid_response)
+    upstream.route(
+        "GET",
+        "/api/status",
+        error=management_api.NodeInvalidResponseError("webcam returned non-UTF8 payload"),
+    )
 
-    response = client.get("/api/v1/webcams/node-non-utf8-status/status", headers=_auth_headers())
+    response = client.get("/api/v1/webcams/node-non-utf8-status/status", headers=_AUTH_HEADERS)
     assert response.status_code == 502
     assert response.json["error"]["code"] == "WEBCAM_INVALID_RESPONSE"
     assert response.json["error"]["details"]["reason"] == "malformed json"
 
 
-def test_docker_status_maps_non_utf8_payload_to_controlled_error(monkeypatch, tmp_path):
-    client, management_api = _new_management_client(monkeypatch, tmp_path)
-
-    payload = {
-        "id": "docker-non-utf8",
-        "name": "Docker Non UTF8",
-        "base_url": "docker://docker-proxy:2375/motion-in-ocean-webcam",
-        "auth": {"type": "none"},
-        "labels": {},
-        "last_seen": datetime.now(timezone.utc).isoformat(),
-        "capabilities": ["stream"],
-        "transport": "docker",
-    }
-
-    created = client.post("/api/v1/webcams", json=payload, headers=_auth_headers())
-    assert created.status_code == 201
+def test_docker_status_maps_non_utf8_payload_to_controlled_error(
+    monkeypatch, client, registered_node
+):
+    registered_node(
+        id="docker-non-utf8",
+        name="Docker Non UTF8",
+        base_url="docker://docker-proxy:2375/motion-in-ocean-webcam",
+        transport="docker",
+    )
 
     def raise_invalid_response(proxy_host, proxy_port, container_id, auth_headers):
         raise management_api.NodeInvalidResponseError("webcam returned non-UTF8 payload")
@@ -3149,7 +3197,7 @@ def test_docker_status_maps_non_utf8_payload_to_controlled_error(monkeypatch, tm
         raise_invalid_response,
     )
 
-    response = client.get("/api/v1/webcams/docker-non-utf8/status", headers=_auth_headers())
+    response = client.get("/api/v1/webcams/docker-non-utf8/status", headers=_AUTH_HEADERS)
     assert response.status_code == 502
     assert response.json["error"]["code"] == "WEBCAM_INVALID_RESPONSE"
     assert response.json["error"]["details"]["reason"] == "malformed json"
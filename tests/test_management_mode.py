@@ -5,14 +5,10 @@ import threading
 import time
 from pathlib import Path
 
+from pi_camera_in_docker import main
 from pi_camera_in_docker.application_settings import ApplicationSettings
 
 
-# Add workspace root to sys.path for proper package imports
-workspace_root = Path(__file__).parent.parent
-sys.path.insert(0, str(workspace_root))
-
-
 def test_management_mode_boots_without_camera(monkeypatch):
     # Set NODE_REGISTRY_PATH to a temp directory to avoid permission issues
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -24,8 +20,9 @@ def test_management_mode_boots_without_camera(monkeypatch):
         sys.modules.pop("pi_camera_in_docker.main", None)
         sys.modules.pop("picamera2", None)
 
-        main = importlib.import_module("pi_camera_in_docker.main")
-        client = main.create_management_app(main._load_config()).test_client()
+        # Re-import so the assertion below covers main's import-time side effects.
+        fresh_main = importlib.import_module("pi_camera_in_docker.main")
+        client = fresh_main.create_management_app(fresh_main._load_config()).test_client()
 
         health = client.get("/health")
         assert health.status_code == 200
@@ -70,9 +67,6 @@ def test_webcam_mode_env_validation_and_startup(monkeypatch):
         monkeypatch.setenv("MIO_MAX_FRAME_AGE_SECONDS", "-1")
         monkeypatch.setenv("MIO_MAX_STREAM_CONNECTIONS", "not_an_int")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-
         cfg = main._load_config()
         assert cfg["resolution"] == (640, 480)
         assert cfg["fps"] == 24
@@ -94,8 +88,6 @@ def test_root_serves_management_template_in_management_mode(monkeypatch):
         monkeypatch.setenv("MIO_APPLICATION_SETTINGS_PATH", f"{tmpdir}/application-settings.json")
         monkeypatch.setenv("MIO_APP_MODE", "management")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
         client = main.create_management_app(main._load_config()).test_client()
 
         response = client.get("/")
@@ -112,8 +104,6 @@ def test_root_serves_stream_template_in_webcam_mode(monkeypatch):
         monkeypatch.setenv("MIO_APP_MODE", "management")
         monkeypatch.setenv("MIO_MOCK_CAMERA", "true")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
         cfg = main._load_config()
         cfg["app_mode"] = "webcam"
         cfg["mock_camera"] = True
@@ -135,8 +125,6 @@ def test_api_config_returns_render_config_shape_in_management_mode(monkeypatch):
         monkeypatch.setenv("MIO_CORS_ORIGINS", "https://example.test")
         monkeypatch.setenv("MIO_MOCK_CAMERA", "false")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
         app = main.create_management_app(main._load_config())
         client = app.test_client()
 
@@ -199,8 +187,6 @@ def test_api_config_webcam_includes_render_config_keys_and_defaulted_values(monk
         monkeypatch.setenv("MIO_MAX_FRAME_AGE_SECONDS", "invalid")
         monkeypatch.setenv("MIO_CORS_ORIGINS", "")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
         cfg = main._load_config()
         cfg["app_mode"] = "webcam"
         cfg["mock_camera"] = True
@@ -239,8 +225,6 @@ def test_api_config_management_includes_render_config_keys_and_defaulted_values(
         monkeypatch.setenv("MIO_MAX_FRAME_AGE_SECONDS", "invalid")
         monkeypatch.setenv("MIO_CORS_ORIGINS", "")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
         client = main.create_management_app(main._load_config()).test_client()
 
         response = client.get("/api/config")
@@ -269,8 +253,6 @@ def test_request_logging_levels(monkeypatch):
         monkeypatch.setenv("MIO_APPLICATION_SETTINGS_PATH", f"{tmpdir}/application-settings.json")
         monkeypatch.setenv("MIO_APP_MODE", "management")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
         client = main.create_management_app(main._load_config()).test_client()
 
         records = []
@@ -327,19 +309,11 @@ def _new_webcam_client(monkeypatch, webcam_token: str):
 
     monkeypatch.setattr(ApplicationSettings, "__init__", mock_app_settings_init)
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(0, str(workspace_root))  # Add parent dir to sys.path
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        from pi_camera_in_docker import main
-
-        cfg = main._load_config()
-        cfg["app_mode"] = "webcam"
-        cfg["mock_camera"] = True
-        app = main.create_webcam_app(cfg)
-        return app.test_client()
-    finally:
-        sys.path = original_sys_path
+    cfg = main._load_config()
+    cfg["app_mode"] = "webcam"
+    cfg["mock_camera"] = True
+    app = main.create_webcam_app(cfg)
+    return app.test_client()
 
 
 def test_webcam_control_plane_endpoints_do_not_require_auth_when_token_unset(monkeypatch):
@@ -540,8 +514,6 @@ def test_webcam_api_test_status_remains_structurally_consistent_during_concurren
         monkeypatch.setenv("MIO_MOCK_CAMERA", "true")
         monkeypatch.setenv("MIO_WEBCAM_CONTROL_PLANE_AUTH_TOKEN", "node-shared-token")
 
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
         cfg = main._load_config()
         cfg["app_mode"] = "webcam"
         cfg["mock_camera"] = True
@@ -5,11 +5,6 @@ GET /api/docs serves the Swagger UI HTML page.
 """
 
 import importlib
-import sys
-from pathlib import Path
-
-
-workspace_root = Path(__file__).parent.parent
 
 
 def _new_management_client(monkeypatch, tmp_path, management_token="test-token"):
@@ -22,15 +17,8 @@ def _new_management_client(monkeypatch, tmp_path, management_token="test-token")
     monkeypatch.setenv("MIO_MANAGEMENT_AUTH_TOKEN", management_token)
     monkeypatch.setenv("MIO_NODE_DISCOVERY_SHARED_SECRET", "discovery-secret")
 
-    original_sys_path = sys.path.copy()
-    sys.path.insert(0, str(workspace_root))
-    try:
-        sys.modules.pop("pi_camera_in_docker.main", None)
-        sys.modules.pop("pi_camera_in_docker.management_api", None)
-        main = importlib.import_module("pi_camera_in_docker.main")
-        return main.create_management_app(main._load_config()).test_client()
-    finally:
-        sys.path = original_sys_path
+    main = importlib.import_module("pi_camera_in_docker.main")
+    return main.create_management_app(main._load_config()).test_client()
 
 
 class TestOpenAPISpec: